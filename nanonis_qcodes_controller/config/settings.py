@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +11,11 @@ import yaml
 
 from .default_files import resolve_packaged_default
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 DEFAULT_RUNTIME_CONFIG_FILE = Path("config/default_runtime.yaml")
 DEFAULT_PORTS = (3364, 6501, 6502, 6503, 6504)
 DEFAULT_RAMP_INTERVAL_S = 0.05
@@ -208,13 +214,26 @@ def _resolve_config_path(
 def _load_config_mapping(config_path: Path | None, *, require_exists: bool) -> dict[str, Any]:
     if config_path is None:
         return {}
-    if not config_path.exists():
+    try:
+        stat_result = config_path.stat()
+    except OSError:
         if require_exists:
-            raise ValueError(f"Runtime config file does not exist: {config_path}")
+            raise ValueError(f"Runtime config file does not exist: {config_path}") from None
         return {}
 
-    with config_path.open("r", encoding="utf-8") as handle:
-        loaded = yaml.safe_load(handle)
+    return _load_config_mapping_cached(
+        str(config_path), stat_result.st_mtime_ns, stat_result.st_size
+    )
+
+
+@lru_cache(maxsize=32)
+def _load_config_mapping_cached(path_text: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    # mtime_ns and size are cache-key components only; either changing
+    # invalidates the entry, so repeat loads of an unchanged file skip the
+    # YAML parse. Callers treat the returned mapping as read-only.
+    del mtime_ns, size
+    with Path(path_text).open("r", encoding="utf-8") as handle:
+        loaded = yaml.load(handle, Loader=_YamlLoader)
 
     if loaded is None:
         return {}
@@ -1,10 +1,14 @@
+from typing import TYPE_CHECKING, Any
+
 from .extensions import (
     ActionSpec,
     ParameterSpec,
     load_action_specs,
     load_parameter_specs,
 )
-from .instrument import QcodesNanonisSTM
+
+if TYPE_CHECKING:
+    from .instrument import QcodesNanonisSTM
 
 __all__ = [
     "QcodesNanonisSTM",
@@ -13,3 +17,13 @@ __all__ = [
     "load_action_specs",
     "load_parameter_specs",
 ]
+
+
+# Importing .instrument pulls in qcodes, which dominates package import time;
+# defer it until the driver class is actually requested (PEP 562).
+def __getattr__(name: str) -> Any:
+    if name == "QcodesNanonisSTM":
+        from .instrument import QcodesNanonisSTM
+
+        return QcodesNanonisSTM
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal, cast
 
@@ -9,6 +10,11 @@ import yaml
 
 from nanonis_qcodes_controller.config.default_files import resolve_packaged_default
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 DEFAULT_PARAMETERS_FILE = Path("config/parameters.yaml")
 
 ScalarValueType = Literal["float", "int", "bool", "str"]
@@ -18,7 +24,7 @@ _ALLOWED_VALUE_TYPES: frozenset[str] = frozenset({"float", "int", "bool", "str"}
 _ALLOWED_ACTION_SAFETY_MODES: frozenset[str] = frozenset({"alwaysAllowed", "guarded", "blocked"})
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResponseFieldSpec:
     index: int
     name: str
@@ -28,7 +34,7 @@ class ResponseFieldSpec:
     description: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArgFieldSpec:
     name: str
     type: str
@@ -39,7 +45,7 @@ class ArgFieldSpec:
     default: Any = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReadCommandSpec:
     command: str
     payload_index: int = 0
@@ -48,7 +54,7 @@ class ReadCommandSpec:
     response_fields: tuple[ResponseFieldSpec, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WriteCommandSpec:
     command: str
     value_arg: str = ""
@@ -56,21 +62,21 @@ class WriteCommandSpec:
     arg_fields: tuple[ArgFieldSpec, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActionCommandSpec:
     command: str
     description: str = ""
     arg_fields: tuple[ArgFieldSpec, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActionSpec:
     name: str
     action_cmd: ActionCommandSpec
     safety_mode: ActionSafetyMode = "guarded"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SafetySpec:
     min_value: float | None
     max_value: float | None
@@ -81,7 +87,7 @@ class SafetySpec:
     ramp_interval_s: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParameterSpec:
     name: str
     label: str
@@ -128,9 +134,21 @@ def _infer_scalar_value_type(value: Any) -> ScalarValueType:
 
 def load_parameter_specs(parameter_file: str | Path) -> tuple[ParameterSpec, ...]:
     manifest_path = _resolve_manifest_path(parameter_file)
+    stat_result = manifest_path.stat()
+    return _load_parameter_specs_cached(
+        str(manifest_path), stat_result.st_mtime_ns, stat_result.st_size
+    )
+
 
-    with manifest_path.open("r", encoding="utf-8") as handle:
-        loaded = yaml.safe_load(handle)
+# The spec dataclasses are frozen and the result is a tuple, so cached
+# instances are safe to share; mtime_ns/size invalidate on file edits.
+@lru_cache(maxsize=32)
+def _load_parameter_specs_cached(
+    path_text: str, mtime_ns: int, size: int
+) -> tuple[ParameterSpec, ...]:
+    del mtime_ns, size
+    with Path(path_text).open("r", encoding="utf-8") as handle:
+        loaded = yaml.load(handle, Loader=_YamlLoader)
 
     if loaded is None:
         return ()
@@ -151,9 +169,17 @@ def load_parameter_specs(parameter_file: str | Path) -> tuple[ParameterSpec, ...
 
 def load_action_specs(parameter_file: str | Path) -> tuple[ActionSpec, ...]:
     manifest_path = _resolve_manifest_path(parameter_file)
+    stat_result = manifest_path.stat()
+    return _load_action_specs_cached(
+        str(manifest_path), stat_result.st_mtime_ns, stat_result.st_size
+    )
+
 
-    with manifest_path.open("r", encoding="utf-8") as handle:
-        loaded = yaml.safe_load(handle)
+@lru_cache(maxsize=32)
+def _load_action_specs_cached(path_text: str, mtime_ns: int, size: int) -> tuple[ActionSpec, ...]:
+    del mtime_ns, size
+    with Path(path_text).open("r", encoding="utf-8") as handle:
+        loaded = yaml.load(handle, Loader=_YamlLoader)
 
     if loaded is None:
         return ()
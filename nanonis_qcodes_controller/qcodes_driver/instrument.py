@@ -405,6 +405,16 @@ class QcodesNanonisSTM(Instrument):  # type: ignore[misc,unused-ignore]
         self._record_state_transition(state_key=spec.name, value=_state_value(value))
         return value
 
+    def read_batch(self, parameter_names: Sequence[str]) -> dict[str, Any]:
+        # Coalesces a polling sweep into one driver entry point. The
+        # nanonis_spm backend blocks on each request/response pair, so the
+        # commands still go out sequentially, but callers get a single call
+        # site that a pipelined transport could later accelerate.
+        names = tuple(str(name).strip() for name in parameter_names)
+        if not names or any(not name for name in names):
+            raise ValueError("parameter_names must contain non-empty names.")
+        return {name: self.get_parameter_value(name) for name in names}
+
     def get_parameter_snapshot(self, parameter_name: str) -> Mapping[str, Any]:
         spec = self.parameter_spec(parameter_name)
         if spec.get_cmd is None:
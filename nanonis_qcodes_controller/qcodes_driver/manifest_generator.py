@@ -5,11 +5,21 @@ import html
 import importlib
 import importlib.metadata
 import inspect
+import json
+import operator
 import re
+import sys
 import textwrap
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
 ScalarValueType = str
 
 _SCALAR_TYPES: tuple[str, ...] = ("float", "int", "bool", "str")
@@ -50,8 +60,36 @@ _VALUE_TOKENS: tuple[str, ...] = (
     "angle",
 )
 
+# Compiled once at import: these patterns run for every discovered command and
+# every docstring line, where re's per-call pattern-cache lookup adds up.
+_NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9]+")
+_NON_WORD_RE = re.compile(r"\W+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_PAREN_GROUP_RE = re.compile(r"\(([^)]*)\)")
+_PAREN_SPLIT_RE = re.compile(r"\(")
+_NORMALIZE_KEY_RE = re.compile(r"[^a-z0-9]+")
+_METHOD_HEADING_RE = re.compile(r"^[A-Za-z0-9_.]+(Get|Set)$")
+_SECTION_HEADING_RE = re.compile(r"^[ \t]*(?:arguments:|return arguments)", re.IGNORECASE | re.MULTILINE)
+_INT_TOKEN_RE = re.compile(r"\b(unsigned\s+int\d*|uint\d*|int\d*|integer|int)\b")
+_FLOAT_TOKEN_RE = re.compile(r"\b(float\d*|double)\b")
+_STR_TOKEN_RE = re.compile(r"\b(string|str|char|text)\b")
+
+_ACCEPTED_PARAMETER_KINDS = frozenset(
+    {inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY}
+)
 
-@dataclass(frozen=True)
+
+# Signature objects are expensive to build and the same unbound methods are
+# re-introspected on every discovery run (and across tests in one process).
+@lru_cache(maxsize=None)
+def _cached_signature(member: Any) -> inspect.Signature:
+    return inspect.signature(member)
+
+
+# slots avoids a per-instance __dict__ across the hundreds of discovered
+# commands; interning collapses the repeated single-char wire codes into
+# shared strings.
+@dataclass(frozen=True, slots=True)
 class CommandInfo:
     command: str
     arguments: tuple[str, ...]
@@ -61,6 +99,16 @@ class CommandInfo:
     body_wire_types: tuple[str, ...]
     response_wire_types: tuple[str, ...]
 
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "body_wire_types", tuple(sys.intern(code) for code in self.body_wire_types)
+        )
+        object.__setattr__(
+            self,
+            "response_wire_types",
+            tuple(sys.intern(code) for code in self.response_wire_types),
+        )
+
 
 @dataclass(frozen=True)
 class InferredSetMapping:
@@ -68,7 +116,13 @@ class InferredSetMapping:
     fixed_args: dict[str, Any]
 
 
-def discover_nanonis_commands(*, match_pattern: str = "") -> tuple[CommandInfo, ...]:
+# Keyed by the Nanonis class object (not just the module name) so a reloaded
+# or monkeypatched class gets a fresh discovery pass while repeat driver
+# construction against the same class is a dict lookup.
+_DISCOVERY_CACHE: dict[tuple[Any, str, int], tuple[CommandInfo, ...]] = {}
+
+
+def discover_nanonis_commands(*, match_pattern: str = "", limit: int = 0) -> tuple[CommandInfo, ...]:
     try:
         nanonis_spm = importlib.import_module("nanonis_spm")
     except ModuleNotFoundError as exc:
@@ -76,9 +130,18 @@ def discover_nanonis_commands(*, match_pattern: str = "") -> tuple[CommandInfo,
             "nanonis_spm is not installed. Install with: python -m pip install nanonis-spm"
         ) from exc
 
+    cache_key = (nanonis_spm.Nanonis, match_pattern, limit)
+    cached = _DISCOVERY_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     compiled_pattern = re.compile(match_pattern, re.IGNORECASE) if match_pattern else None
     discovered: list[CommandInfo] = []
     ordered_callables: list[tuple[str, Any]] = []
+    anchor_index: int | None = None
+    # Iterating the class __dict__ keeps definition order (needed for the
+    # Bias_Set anchor below) and skips the sorted-getattr walk that
+    # inspect.getmembers would do per name.
     for name, member in nanonis_spm.Nanonis.__dict__.items():
         if name.startswith("_"):
             continue
@@ -87,27 +150,32 @@ def discover_nanonis_commands(*, match_pattern: str = "") -> tuple[CommandInfo,
             callable_member = member.__func__
         if not callable(callable_member):
             continue
+        if anchor_index is None and name == "Bias_Set":
+            anchor_index = len(ordered_callables)
         ordered_callables.append((name, callable_member))
 
-    anchor_index: int | None = None
-    for index, (name, _member) in enumerate(ordered_callables):
-        if name == "Bias_Set":
-            anchor_index = index
-            break
     if anchor_index is None:
         raise ValueError("Could not find Bias_Set anchor in nanonis_spm.Nanonis callables.")
 
-    for name, member in ordered_callables[anchor_index:]:
-        if compiled_pattern is not None and compiled_pattern.search(name) is None:
-            continue
+    # Sort candidate names before the expensive per-command work so a limit
+    # can stop early while still returning the same leading slice the old
+    # discover-everything-then-slice callers saw.
+    candidates = [
+        (name, member)
+        for name, member in ordered_callables[anchor_index:]
+        if compiled_pattern is None or compiled_pattern.search(name) is not None
+    ]
+    candidates.sort(key=operator.itemgetter(0))
+
+    for name, member in candidates:
+        if 0 < limit <= len(discovered):
+            break
 
-        signature = inspect.signature(member)
+        signature = _cached_signature(member)
         arguments = tuple(
             parameter.name
             for parameter in signature.parameters.values()
-            if parameter.name != "self"
-            and parameter.kind
-            in {inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY}
+            if parameter.name != "self" and parameter.kind in _ACCEPTED_PARAMETER_KINDS
         )
         body_arg_names, body_wire_types, response_wire_types = _extract_quicksend_signature(member)
         discovered.append(
@@ -122,8 +190,9 @@ def discover_nanonis_commands(*, match_pattern: str = "") -> tuple[CommandInfo,
             )
         )
 
-    discovered.sort(key=lambda item: item.command)
-    return tuple(discovered)
+    result = tuple(discovered)
+    _DISCOVERY_CACHE[cache_key] = result
+    return result
 
 
 def build_unified_manifest(
@@ -185,19 +254,19 @@ def build_unified_manifest(
         elif generated_entry is not None:
             merged_parameters[name] = generated_entry
 
-    generated_actions: dict[str, dict[str, Any]] = {}
-    for info in sorted(action_commands, key=lambda item: item.command):
-        generated_actions[info.command] = _build_generated_action_entry(info=info)
-
+    # Generate and merge in one pass per action instead of materializing an
+    # intermediate generated-actions dict.
     merged_actions: dict[str, Any] = {}
-    for name in sorted(generated_actions):
-        generated_entry = generated_actions[name]
-        curated_entry = curated_actions.get(name)
+    for info in sorted(action_commands, key=operator.attrgetter("command")):
+        generated_entry = _build_generated_action_entry(info=info)
+        curated_entry = curated_actions.get(info.command)
         if curated_entry is not None:
-            merged_actions[name] = _deep_merge(generated_entry, curated_entry)
+            merged_actions[info.command] = _deep_merge(generated_entry, curated_entry)
         else:
-            merged_actions[name] = generated_entry
+            merged_actions[info.command] = generated_entry
 
+    parameter_description_count = 0
+    writable_count = 0
     for _name, parameter in merged_parameters.items():
         if not isinstance(parameter, dict):
             continue
@@ -277,6 +346,24 @@ def build_unified_manifest(
                     defaults[value_arg] = None
                 set_cmd["arg_fields"] = _arg_fields_from_legacy_args(defaults, value_arg=value_arg)
 
+        # Final cleanup and stats happen in the same pass now that the
+        # entry's get_cmd/set_cmd descriptions are settled.
+        _ = parameter.pop("unit", None)
+        _ = parameter.pop("type", None)
+        _ = parameter.pop("value_type", None)
+        _ = parameter.pop("vals", None)
+        _ = parameter.pop("snapshot_value", None)
+        if (
+            isinstance(get_cmd, dict)
+            and str(get_cmd.get("description", "")).strip()
+            or isinstance(set_cmd, dict)
+            and str(set_cmd.get("description", "")).strip()
+        ):
+            parameter_description_count += 1
+        if set_cmd is not None and set_cmd is not False:
+            writable_count += 1
+
+    action_description_count = 0
     for _name, action in merged_actions.items():
         if not isinstance(action, dict):
             continue
@@ -344,36 +431,13 @@ def build_unified_manifest(
         else:
             action["safety"] = {"mode": "guarded"}
 
+        if isinstance(action_cmd, dict) and str(action_cmd.get("description", "")).strip():
+            action_description_count += 1
+
     defaults = {
         "ramp_default_interval_s": float(curated_defaults.get("ramp_default_interval_s", 0.05)),
     }
 
-    parameter_description_count = 0
-    action_description_count = 0
-    writable_count = 0
-    for parameter in merged_parameters.values():
-        _ = parameter.pop("unit", None)
-        _ = parameter.pop("type", None)
-        _ = parameter.pop("value_type", None)
-        _ = parameter.pop("vals", None)
-        _ = parameter.pop("snapshot_value", None)
-        get_cmd = parameter.get("get_cmd")
-        set_cmd = parameter.get("set_cmd")
-        if (
-            isinstance(get_cmd, dict)
-            and str(get_cmd.get("description", "")).strip()
-            or isinstance(set_cmd, dict)
-            and str(set_cmd.get("description", "")).strip()
-        ):
-            parameter_description_count += 1
-        if set_cmd is not None and set_cmd is not False:
-            writable_count += 1
-
-    for action in merged_actions.values():
-        action_cmd = action.get("action_cmd") if isinstance(action, dict) else None
-        if isinstance(action_cmd, dict) and str(action_cmd.get("description", "")).strip():
-            action_description_count += 1
-
     return {
         "version": 1,
         "defaults": defaults,
@@ -395,28 +459,61 @@ def build_unified_manifest(
     }
 
 
+def load_cached_manifest(cache_path: Path, *, newer_than_ns: int) -> dict[str, Any] | None:
+    # A sidecar JSON parses orders of magnitude faster than rebuilding the
+    # manifest from nanonis_spm introspection. Stale caches (older than the
+    # curated inputs), unreadable files, or caches produced against a
+    # different installed nanonis-spm version are all treated as misses.
+    try:
+        if cache_path.stat().st_mtime_ns < newer_than_ns:
+            return None
+        loaded = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(loaded, dict) or loaded.get("version") != 1:
+        return None
+    meta = loaded.get("meta")
+    if not isinstance(meta, dict):
+        return None
+    if meta.get("source_package") != f"nanonis-spm/{installed_nanonis_spm_version()}":
+        return None
+    return loaded
+
+
+def write_manifest_cache(cache_path: Path, manifest: dict[str, Any]) -> None:
+    # orjson encodes straight to bytes, keeping cache writes cheap enough to
+    # refresh on every rebuild; the read side stays on stdlib json.loads.
+    if orjson is not None:
+        encoded = orjson.dumps(manifest)
+    else:
+        encoded = json.dumps(manifest, separators=(",", ":")).encode("utf-8")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(encoded)
+    except OSError:
+        # The cache is an optimization only; failing to persist it must not
+        # fail the build.
+        pass
+
+
 def extract_description(doc: str | None) -> str:
     if doc is None:
         return ""
     text = html.unescape(str(doc))
-    lines = [line.strip() for line in text.splitlines()]
+    # One C-level scan finds the Arguments/Return-arguments cut point instead
+    # of lowercasing and prefix-testing every line up to it.
+    heading = _SECTION_HEADING_RE.search(text)
+    if heading is not None:
+        text = text[: heading.start()]
 
     cleaned: list[str] = []
-    for line in lines:
-        if not line:
-            continue
-        lowered = line.lower()
-        if lowered.startswith("arguments:") or lowered.startswith("return arguments"):
-            break
-        if line.startswith("--"):
-            continue
-        if _looks_like_method_heading(line):
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line.startswith("--") or _looks_like_method_heading(line):
             continue
         cleaned.append(line)
 
-    description = " ".join(cleaned)
-    description = re.sub(r"\s+", " ", description).strip()
-    return description
+    return _WHITESPACE_RE.sub(" ", " ".join(cleaned)).strip()
 
 
 def infer_set_mapping(
@@ -484,7 +581,7 @@ def infer_set_mapping(
 
 
 def derive_parameter_name(command_name: str) -> str:
-    name = re.sub(r"[^A-Za-z0-9]+", "_", str(command_name)).strip("_").lower()
+    name = _NON_ALNUM_RE.sub("_", str(command_name)).strip("_").lower()
     for suffix in ("_get", "get", "_set", "set"):
         if name.endswith(suffix):
             name = name[: -len(suffix)]
@@ -494,6 +591,7 @@ def derive_parameter_name(command_name: str) -> str:
     return name
 
 
+@lru_cache(maxsize=1)
 def installed_nanonis_spm_version() -> str:
     try:
         return importlib.metadata.version("nanonis-spm")
@@ -677,7 +775,7 @@ def _extract_body_arg_names(node: ast.AST) -> tuple[str, ...]:
             unparsed = ast.unparse(item)
         except Exception:
             unparsed = f"arg_{index}"
-        names.append(re.sub(r"\W+", "_", unparsed).strip("_") or f"arg_{index}")
+        names.append(_NON_WORD_RE.sub("_", unparsed).strip("_") or f"arg_{index}")
     return tuple(names)
 
 
@@ -739,9 +837,7 @@ def _build_arg_fields_from_wire(
         ordered_arg_names = tuple(
             name
             for name in signature.parameters
-            if name != "self"
-            and signature.parameters[name].kind
-            in {inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY}
+            if name != "self" and signature.parameters[name].kind in _ACCEPTED_PARAMETER_KINDS
         )
 
     required_names = set(required_arg_names)
@@ -806,21 +902,36 @@ def _arg_fields_from_legacy_args(
     return fields
 
 
+# Scalar wire tokens resolve through one dict lookup; only array/modifier
+# variants fall through to the string-stripping slow path below.
+_WIRE_TO_PY: dict[str, str] = {
+    "f": "float",
+    "d": "float",
+    "?": "bool",
+    "s": "str",
+    "c": "str",
+    "b": "int",
+    "B": "int",
+    "h": "int",
+    "H": "int",
+    "i": "int",
+    "I": "int",
+    "l": "int",
+    "L": "int",
+    "q": "int",
+    "Q": "int",
+}
+
+
 def _normalize_wire_type(wire_type: str) -> str:
     token = str(wire_type).strip()
     if not token:
         return "unknown"
+    direct = _WIRE_TO_PY.get(token)
+    if direct is not None:
+        return direct
     is_array = "*" in token
-    normalized = token.replace("+", "").replace("*", "")
-    base = "unknown"
-    if normalized in {"f", "d"}:
-        base = "float"
-    elif normalized in {"?"}:
-        base = "bool"
-    elif normalized in {"s", "c"}:
-        base = "str"
-    elif normalized in {"b", "B", "h", "H", "i", "I", "l", "L", "q", "Q"}:
-        base = "int"
+    base = _WIRE_TO_PY.get(token.replace("+", "").replace("*", ""), "unknown")
     if is_array and base != "unknown":
         return f"array[{base}]"
     if is_array:
@@ -937,12 +1048,12 @@ def _extract_doc_item_name(item: str) -> str:
     base = str(item)
     if " is " in base:
         base = base.split(" is ", 1)[0]
-    base = re.split(r"\(", base, maxsplit=1)[0].strip()
+    base = _PAREN_SPLIT_RE.split(base, maxsplit=1)[0].strip()
     return base
 
 
 def _extract_doc_type_and_unit(item: str) -> tuple[str, str]:
-    groups = [str(group).strip() for group in re.findall(r"\(([^)]*)\)", item)]
+    groups = [str(group).strip() for group in _PAREN_GROUP_RE.findall(item)]
     if not groups:
         return ("unknown", "")
 
@@ -1027,7 +1138,7 @@ def _parse_argument_docs(doc: str) -> dict[str, str]:
         head = item
         if " is " in head:
             head = head.split(" is ", 1)[0]
-        head = re.split(r"\(", head, maxsplit=1)[0].strip()
+        head = _PAREN_SPLIT_RE.split(head, maxsplit=1)[0].strip()
         normalized = _normalize_key(head)
         if normalized:
             mapped[normalized] = item
@@ -1158,7 +1269,7 @@ def _extract_first_return_line(doc: str) -> str:
 def _extract_unit_from_doc_line(line: str) -> str:
     if not line:
         return ""
-    groups = re.findall(r"\(([^)]*)\)", line)
+    groups = _PAREN_GROUP_RE.findall(line)
     if len(groups) < 2:
         return ""
     candidate = str(groups[-2]).strip()
@@ -1242,11 +1353,11 @@ def _infer_scalar_type_from_text(text: str) -> ScalarValueType | None:
         return None
     if any(token in lowered for token in ("bool", "boolean", "on/off", "onoff")):
         return "bool"
-    if re.search(r"\b(unsigned\s+int\d*|uint\d*|int\d*|integer|int)\b", lowered):
+    if _INT_TOKEN_RE.search(lowered):
         return "int"
-    if re.search(r"\b(float\d*|double)\b", lowered):
+    if _FLOAT_TOKEN_RE.search(lowered):
         return "float"
-    if re.search(r"\b(string|str|char|text)\b", lowered):
+    if _STR_TOKEN_RE.search(lowered):
         return "str"
     return None
 
@@ -1299,13 +1410,13 @@ def _guess_value_type(command_name: str) -> ScalarValueType:
 
 
 def _normalize_key(text: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "", str(text).lower())
+    return _NORMALIZE_KEY_RE.sub("", str(text).lower())
 
 
 def _looks_like_method_heading(line: str) -> bool:
     if " " in line:
         return False
-    return bool(re.match(r"^[A-Za-z0-9_.]+(Get|Set)$", line))
+    return bool(_METHOD_HEADING_RE.match(line))
 
 
 def _utc_now_string() -> str:
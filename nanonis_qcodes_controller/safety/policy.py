@@ -7,12 +7,17 @@ from dataclasses import dataclass, field
 
 from nanonis_qcodes_controller.config import SafetySettings
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover - numpy arrives via the qcodes extra
+    numpy = None  # type: ignore[assignment]
+
 
 class PolicyViolation(ValueError):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChannelLimit:
     min_value: float | None
     max_value: float | None
@@ -22,7 +27,7 @@ class ChannelLimit:
     ramp_interval_s: float | None = 0.05
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WritePlan:
     channel: str
     current_value: float
@@ -38,7 +43,7 @@ class WritePlan:
         return len(self.steps)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WriteExecutionReport:
     channel: str
     dry_run: bool
@@ -49,7 +54,7 @@ class WriteExecutionReport:
     final_value: float
 
 
-@dataclass
+@dataclass(slots=True)
 class WritePolicy:
     allow_writes: bool = False
     dry_run: bool = True
@@ -267,6 +272,11 @@ def _build_steps(*, current: float, target: float, limit: ChannelLimit) -> tuple
         slew_step_size = limit.max_slew_per_s * ramp_interval_s
         step_count = max(step_count, math.ceil(abs(delta) / slew_step_size))
 
+    if numpy is not None:
+        # linspace guarantees an exact endpoint, so no target patch-up needed;
+        # tolist() hands back native floats, keeping plan.steps a plain tuple.
+        return tuple(numpy.linspace(current, target, step_count + 1)[1:].tolist())
+
     increment = delta / step_count
     steps = tuple(current + increment * step_index for step_index in range(1, step_count + 1))
     if steps[-1] != target:
@@ -1,3 +1,4 @@
+from .indexer import SqliteSegmentIndexer
 from .journal import TrajectoryJournal, TrajectoryStats
 from .monitor_config import (
     MonitorConfig,
@@ -12,6 +13,7 @@ from .monitor_config import (
 from .reader import follow_events, read_events
 
 __all__ = [
+    "SqliteSegmentIndexer",
     "TrajectoryJournal",
     "TrajectoryStats",
     "MonitorConfig",
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from .sqlite_store import TrajectorySQLiteStore
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+if orjson is None:
+    _json_loads = json.loads
+else:
+
+    def _json_loads(data: str | bytes) -> Any:
+        # The journal writer uses stdlib json.dumps, which emits bare
+        # NaN/Infinity tokens for non-finite readings; orjson rejects those,
+        # so fall back to the stdlib parser for such lines.
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+SAMPLE_PAIR_EVENT_TYPE = "sample_pair"
+
+
+class SqliteSegmentIndexer:
+    def __init__(self, *, store: TrajectorySQLiteStore, directory: str | Path) -> None:
+        self._store = store
+        self._directory = Path(directory)
+        self._indexed_files: set[Path] = set()
+
+    def indexed_file_names(self) -> set[str]:
+        return {path.name for path in self._indexed_files}
+
+    def index_new_segments(self, *, skip_file: str | Path | None = None) -> int:
+        skip_path = None if skip_file is None else Path(skip_file)
+        indexed_rows = 0
+
+        for file_path in self._list_segment_files():
+            if file_path in self._indexed_files:
+                continue
+            if skip_path is not None and file_path == skip_path:
+                continue
+            indexed_rows += self._index_segment(file_path)
+            self._indexed_files.add(file_path)
+
+        return indexed_rows
+
+    def _index_segment(self, file_path: Path) -> int:
+        rows: list[tuple[int, int, int, float, Any, Any]] = []
+        data = file_path.read_bytes()
+        for line in data.split(b"\n"):
+            if not line.strip():
+                continue
+            event = _json_loads(line)
+            if event.get("event_type") != SAMPLE_PAIR_EVENT_TYPE:
+                continue
+            payload = event.get("payload") or {}
+            rows.append(
+                (
+                    int(payload["run_id"]),
+                    int(payload["signal_id"]),
+                    int(payload["spec_id"]),
+                    float(payload["dt_s"]),
+                    payload.get("signal_values"),
+                    payload.get("spec_values"),
+                )
+            )
+
+        self._store.insert_sample_pairs_bulk(rows)
+        return len(rows)
+
+    def _list_segment_files(self) -> list[Path]:
+        try:
+            with os.scandir(self._directory) as entries:
+                return sorted(
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.startswith("trajectory-")
+                    and entry.name.endswith(".jsonl")
+                    and entry.is_file()
+                )
+        except FileNotFoundError:
+            return []
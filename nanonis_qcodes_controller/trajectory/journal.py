@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import queue
+import struct
 import threading
 import time
 import uuid
@@ -38,7 +39,7 @@ class TrajectoryJournal:
             raise ValueError("writer_delay_s must be non-negative.")
 
         self._directory = Path(directory)
-        self._queue: queue.Queue[dict[str, Any]] = queue.Queue(maxsize=queue_size)
+        self._queue: queue.Queue[dict[str, Any] | bytes] = queue.Queue(maxsize=queue_size)
         self._max_events_per_file = max_events_per_file
         self._writer_delay_s = writer_delay_s
 
@@ -57,6 +58,11 @@ class TrajectoryJournal:
         self._active_file_path: Path | None = None
         self._active_file_handle: Any = None
 
+        self._binary_segment_index = 0
+        self._binary_segment_count = 0
+        self._binary_file_path: Path | None = None
+        self._binary_file_handle: Any = None
+
     def start(self) -> None:
         with self._lock:
             if self._thread is not None and self._thread.is_alive():
@@ -90,6 +96,7 @@ class TrajectoryJournal:
 
         with self._lock:
             self._close_active_file()
+            self._close_binary_file()
             self._thread = None
 
     def emit(
@@ -99,6 +106,14 @@ class TrajectoryJournal:
         *,
         timestamp_utc: str | None = None,
     ) -> bool:
+        # Check for a full queue before building the event: a dropped event
+        # should not pay for uuid generation or timestamp formatting.
+        if self._queue.full():
+            with self._lock:
+                self._submitted += 1
+                self._dropped += 1
+            return False
+
         event = {
             "event_id": uuid.uuid4().hex,
             "timestamp_utc": _now_utc_iso() if timestamp_utc is None else str(timestamp_utc),
@@ -112,6 +127,32 @@ class TrajectoryJournal:
         try:
             self._queue.put_nowait(event)
             return True
+        except queue.Full:
+            # Another emitter may fill the queue between the check and the put.
+            with self._lock:
+                self._dropped += 1
+            return False
+
+    def emit_binary(self, record_type: int, packed: bytes) -> bool:
+        # Fixed-schema hot events skip JSON entirely: the caller struct-packs
+        # the payload once and the record lands in a sidecar .bin segment.
+        if record_type < 0 or record_type > 0xFFFF:
+            raise ValueError("record_type must fit in an unsigned 16-bit integer.")
+
+        if self._queue.full():
+            with self._lock:
+                self._submitted += 1
+                self._dropped += 1
+            return False
+
+        record = _BINARY_RECORD_HEADER.pack(record_type, len(packed)) + packed
+
+        with self._lock:
+            self._submitted += 1
+
+        try:
+            self._queue.put_nowait(record)
+            return True
         except queue.Full:
             with self._lock:
                 self._dropped += 1
@@ -139,7 +180,10 @@ class TrajectoryJournal:
                 continue
 
             try:
-                self._write_event(event)
+                if isinstance(event, bytes):
+                    self._write_binary_record(event)
+                else:
+                    self._write_event(event)
             except (
                 Exception
             ) as exc:  # pragma: no cover - filesystem failures are environment dependent
@@ -163,6 +207,21 @@ class TrajectoryJournal:
             self._segment_count += 1
             self._written += 1
 
+    def _write_binary_record(self, record: bytes) -> None:
+        with self._lock:
+            if (
+                self._binary_file_handle is None
+                or self._binary_segment_count >= self._max_events_per_file
+            ):
+                self._rotate_binary_file()
+
+            assert self._binary_file_handle is not None
+            self._binary_file_handle.write(record)
+            self._binary_file_handle.flush()
+
+            self._binary_segment_count += 1
+            self._written += 1
+
     def _rotate_file(self) -> None:
         self._close_active_file()
         self._segment_index += 1
@@ -171,11 +230,29 @@ class TrajectoryJournal:
         self._active_file_path = self._directory / file_name
         self._active_file_handle = self._active_file_path.open("a", encoding="utf-8")
 
+    def _rotate_binary_file(self) -> None:
+        self._close_binary_file()
+        self._binary_segment_index += 1
+        self._binary_segment_count = 0
+        file_name = f"trajectory-{self._run_id}-{self._binary_segment_index:05d}.bin"
+        self._binary_file_path = self._directory / file_name
+        self._binary_file_handle = self._binary_file_path.open("ab")
+
     def _close_active_file(self) -> None:
         if self._active_file_handle is not None:
             self._active_file_handle.close()
             self._active_file_handle = None
 
+    def _close_binary_file(self) -> None:
+        if self._binary_file_handle is not None:
+            self._binary_file_handle.close()
+            self._binary_file_handle = None
+
+
+# Each binary record is a little-endian (record_type: u16, payload_length: u32)
+# header followed by the caller-packed payload bytes.
+_BINARY_RECORD_HEADER = struct.Struct("<HI")
+
 
 def _now_utc_iso() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="microseconds").replace("+00:00", "Z")
@@ -34,6 +34,7 @@ class TrajectoryMonitorRunner:
         self._run_id = run_id
         self._run_start_utc = run_start_utc
         self._interval_s = interval_s
+        self._interval_ns = round(interval_s * 1e9)
         self._rotate_entries = rotate_entries
         self._poll_signals = poll_signals
         self._poll_specs = poll_specs
@@ -42,6 +43,8 @@ class TrajectoryMonitorRunner:
         self._sleep_s = sleep_s or time.sleep
 
         self._sample_idx = 0
+        self._pending_samples: list[tuple[int, int, int, float, object, object]] = []
+        self._flush_every = max(1, rotate_entries // 10)
         self._run_start_monotonic_s: float | None = None
         self._signal_catalog_ids: dict[int, int] = {}
         self._spec_catalog_ids: dict[int, int] = {}
@@ -57,30 +60,38 @@ class TrajectoryMonitorRunner:
             raise ValueError("count must be non-negative.")
 
         completed = 0
-        for _ in range(count):
-            sample_idx = self._sample_idx
-            self._wait_until_scheduled_sample_time(sample_idx)
-            segment_id = sample_idx // self._rotate_entries
-            signal_id = self._signal_catalog_id_for_segment(segment_id)
-            spec_id = self._spec_catalog_id_for_segment(segment_id)
-            dt_s = self._elapsed_seconds()
-            signal_values = self._poll_signals()
-            spec_values = self._poll_specs()
-
-            self._store.insert_sample_pair(
-                run_id=self._run_id,
-                signal_id=signal_id,
-                spec_id=spec_id,
-                dt_s=dt_s,
-                signal_values_json=signal_values,
-                spec_vals_json=spec_values,
-            )
-            self._record_spec_change_events(dt_s=dt_s, spec_values=spec_values)
-            self._sample_idx = sample_idx + 1
-            completed += 1
-
+        # The final flush runs on teardown too: an interrupt or poll failure
+        # mid-batch must not drop samples that were already taken, or the
+        # completed count reported by callers would overstate the store.
+        try:
+            for _ in range(count):
+                sample_idx = self._sample_idx
+                self._wait_until_scheduled_sample_time(sample_idx)
+                segment_id = sample_idx // self._rotate_entries
+                signal_id = self._signal_catalog_id_for_segment(segment_id)
+                spec_id = self._spec_catalog_id_for_segment(segment_id)
+                dt_s = self._elapsed_seconds()
+                signal_values = self._poll_signals()
+                spec_values = self._poll_specs()
+
+                self._pending_samples.append(
+                    (self._run_id, signal_id, spec_id, dt_s, signal_values, spec_values)
+                )
+                if len(self._pending_samples) >= self._flush_every:
+                    self._flush_pending_samples()
+                self._record_spec_change_events(dt_s=dt_s, spec_values=spec_values)
+                self._sample_idx = sample_idx + 1
+                completed += 1
+        finally:
+            self._flush_pending_samples()
         return completed
 
+    def _flush_pending_samples(self) -> None:
+        if not self._pending_samples:
+            return
+        self._store.insert_sample_pairs_bulk(self._pending_samples)
+        self._pending_samples = []
+
     def _record_spec_change_events(self, *, dt_s: float, spec_values: dict[str, object]) -> None:
         current_specs_by_label = dict(spec_values)
         if not self._has_previous_specs_snapshot:
@@ -89,18 +100,29 @@ class TrajectoryMonitorRunner:
             return
 
         previous_specs_by_label = self._previous_specs_by_label
+        # Steady state: the snapshot matches the previous tick, so skip the
+        # per-label diff entirely. dict equality compares in C and
+        # short-circuits on the first differing value.
+        if current_specs_by_label == previous_specs_by_label:
+            return
+
         changed_labels = sorted(set(previous_specs_by_label) | set(current_specs_by_label))
-        detected_at_utc = _iso_utc_now()
+        # Formatted lazily: in steady state nothing changes and no wall-clock
+        # read or string build happens at all.
+        detected_at_utc: str | None = None
         signal_window_start_dt_s = dt_s - self._action_window_s
         signal_window_end_dt_s = dt_s + self._action_window_s
 
         for spec_label in changed_labels:
             old_value = previous_specs_by_label.get(spec_label)
             new_value = current_specs_by_label.get(spec_label)
-            if old_value == new_value:
+            if old_value is new_value or old_value == new_value:
                 continue
             delta_value = _compute_delta_value(old_value=old_value, new_value=new_value)
+            if detected_at_utc is None:
+                detected_at_utc = _iso_utc_now()
 
+            self._flush_pending_samples()
             self._store.insert_action_event(
                 run_id=self._run_id,
                 dt_s=dt_s,
@@ -119,7 +141,9 @@ class TrajectoryMonitorRunner:
     def _wait_until_scheduled_sample_time(self, sample_idx: int) -> None:
         if self._run_start_monotonic_s is None:
             self._run_start_monotonic_s = self._monotonic_time_s()
-        scheduled_time_s = self._run_start_monotonic_s + (sample_idx * self._interval_s)
+        # sample_idx * interval is computed in integer nanoseconds so the
+        # offset stays exact over long runs instead of accumulating float error.
+        scheduled_time_s = self._run_start_monotonic_s + (sample_idx * self._interval_ns) * 1e-9
         sleep_duration_s = scheduled_time_s - self._monotonic_time_s()
         if sleep_duration_s > 0.0:
             self._sleep_s(sleep_duration_s)
@@ -163,13 +187,25 @@ class TrajectoryMonitorRunner:
         }
 
 
+_UTC = timezone.utc
+
+
 def _iso_utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    # An aware-UTC isoformat always ends in "+00:00"; slicing it off beats a
+    # full-string replace scan per emitted event.
+    return datetime.now(_UTC).isoformat()[:-6] + "Z"
 
 
 def _compute_delta_value(*, old_value: object, new_value: object) -> float | None:
-    if isinstance(old_value, bool) or isinstance(new_value, bool):
+    old_type = type(old_value)
+    new_type = type(new_value)
+    if old_type is bool or new_type is bool:
         return None
+    # Exact-type check first as the fast path for plain ints/floats, then
+    # isinstance so numeric subclasses (numpy scalars from instrument polls)
+    # still produce a delta.
+    if (old_type is int or old_type is float) and (new_type is int or new_type is float):
+        return float(new_value) - float(old_value)  # type: ignore[arg-type]
     if isinstance(old_value, (int, float)) and isinstance(new_value, (int, float)):
         return float(new_value) - float(old_value)
     return None
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -9,10 +10,20 @@ import yaml
 
 from nanonis_qcodes_controller.config.default_files import resolve_packaged_default
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
 DEFAULT_MONITOR_DEFAULTS_FILE = Path("config/default_trajectory_monitor.yaml")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MonitorDefaults:
     interval_s: float
     rotate_entries: int
@@ -23,7 +34,7 @@ class MonitorDefaults:
     spec_labels: tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MonitorConfig:
     run_name: str
     interval_s: float
@@ -62,11 +73,23 @@ def load_monitor_defaults(path: Path | None = None) -> MonitorDefaults:
             defaults_path = resolve_packaged_default("default_trajectory_monitor.yaml")
     else:
         defaults_path = Path(path)
-    if not defaults_path.exists():
-        raise ValueError(f"Trajectory monitor defaults file does not exist: {defaults_path}")
+    try:
+        mtime_ns = defaults_path.stat().st_mtime_ns
+    except OSError as exc:
+        raise ValueError(
+            f"Trajectory monitor defaults file does not exist: {defaults_path}"
+        ) from exc
 
+    return _load_monitor_defaults_cached(str(defaults_path), mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_monitor_defaults_cached(path_text: str, mtime_ns: int) -> MonitorDefaults:
+    # MonitorDefaults is frozen, so the cached instance can be shared freely;
+    # mtime_ns in the key invalidates the entry whenever the file is edited.
+    defaults_path = Path(path_text)
     with defaults_path.open("r", encoding="utf-8") as handle:
-        loaded = yaml.safe_load(handle)
+        loaded = yaml.load(handle, Loader=_YamlLoader)
 
     root = _as_mapping(loaded, context="root")
     defaults = _as_mapping(root.get("defaults"), context="defaults")
@@ -113,16 +136,38 @@ def default_monitor_config(
     )
 
 
+# Keyed by path text, holding (mtime_ns, size, config): the dashboard reloads
+# this file every refresh, and saves bump the mtime so writers invalidate
+# readers automatically. MonitorConfig is frozen, so sharing entries is safe.
+_STAGED_CONFIG_CACHE: dict[str, tuple[int, int, MonitorConfig]] = {}
+
+
 def load_staged_monitor_config(path: Path | None = None) -> MonitorConfig:
-    defaults = load_monitor_defaults()
     config_path = default_staged_config_path() if path is None else Path(path)
-    if not config_path.exists():
+    try:
+        stat_result = config_path.stat()
+    except OSError:
         return default_monitor_config(run_name="")
 
-    with config_path.open("r", encoding="utf-8") as handle:
-        raw = json.load(handle)
+    path_text = str(config_path)
+    cached = _STAGED_CONFIG_CACHE.get(path_text)
+    if cached is not None and cached[0] == stat_result.st_mtime_ns and cached[1] == stat_result.st_size:
+        return cached[2]
 
-    return _config_from_dict(raw, defaults=defaults)
+    if orjson is not None:
+        raw = orjson.loads(config_path.read_bytes())
+    else:
+        with config_path.open("r", encoding="utf-8") as handle:
+            raw = json.load(handle)
+
+    # Well-typed staged payloads never consult the defaults, so the YAML
+    # defaults load is deferred until coercion actually needs fallbacks.
+    data = raw if isinstance(raw, dict) else {}
+    config = _config_from_staged_payload(data)
+    if config is None:
+        config = _config_from_dict(raw, defaults=load_monitor_defaults())
+    _STAGED_CONFIG_CACHE[path_text] = (stat_result.st_mtime_ns, stat_result.st_size, config)
+    return config
 
 
 def save_staged_monitor_config(config: MonitorConfig, path: Path | None = None) -> Path:
@@ -140,8 +185,11 @@ def save_staged_monitor_config(config: MonitorConfig, path: Path | None = None)
         "spec_labels": list(config.spec_labels),
     }
 
-    with config_path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, ensure_ascii=True, indent=2)
+    if orjson is not None:
+        config_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with config_path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, ensure_ascii=True, indent=2)
 
     return config_path
 
@@ -153,6 +201,16 @@ def clear_staged_run_name(path: Path | None = None) -> MonitorConfig:
     return updated
 
 
+_STAGED_SCALAR_FIELD_TYPES: tuple[tuple[str, type], ...] = (
+    ("run_name", str),
+    ("interval_s", float),
+    ("rotate_entries", int),
+    ("action_window_s", float),
+    ("db_directory", str),
+    ("db_name", str),
+)
+
+
 def _config_from_dict(raw: Any, *, defaults: MonitorDefaults) -> MonitorConfig:
     data = raw if isinstance(raw, dict) else {}
     return MonitorConfig(
@@ -169,6 +227,33 @@ def _config_from_dict(raw: Any, *, defaults: MonitorDefaults) -> MonitorConfig:
     )
 
 
+def _config_from_staged_payload(data: dict[str, Any]) -> MonitorConfig | None:
+    # Payloads written by save_staged_monitor_config carry every field with its
+    # exact type, so they can bypass the per-field coercion pipeline. Anything
+    # else (hand-edited or partial files) returns None and falls back.
+    for field_name, field_type in _STAGED_SCALAR_FIELD_TYPES:
+        if type(data.get(field_name)) is not field_type:
+            return None
+    signal_labels = data.get("signal_labels")
+    spec_labels = data.get("spec_labels")
+    if type(signal_labels) is not list or type(spec_labels) is not list:
+        return None
+    if not all(type(label) is str for label in signal_labels):
+        return None
+    if not all(type(label) is str for label in spec_labels):
+        return None
+    return MonitorConfig(
+        run_name=data["run_name"],
+        interval_s=data["interval_s"],
+        rotate_entries=data["rotate_entries"],
+        action_window_s=data["action_window_s"],
+        db_directory=data["db_directory"],
+        db_name=data["db_name"],
+        signal_labels=tuple(signal_labels),
+        spec_labels=tuple(spec_labels),
+    )
+
+
 def _as_mapping(raw_value: Any, *, context: str) -> dict[str, Any]:
     if raw_value is None:
         return {}
@@ -229,6 +314,11 @@ def _coerce_string(value: Any, default: str) -> str:
 def _coerce_float(value: Any, default: float) -> float:
     if value is None:
         return default
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
     try:
         return float(value)
     except (TypeError, ValueError):
@@ -238,6 +328,8 @@ def _coerce_float(value: Any, default: float) -> float:
 def _coerce_int(value: Any, default: int) -> int:
     if value is None:
         return default
+    if type(value) is int:
+        return value
     try:
         return int(value)
     except (TypeError, ValueError):
@@ -1,11 +1,30 @@
 from __future__ import annotations
 
 import json
+import os
 import time
 from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+if orjson is None:
+    _json_loads = json.loads
+else:
+
+    def _json_loads(data: str | bytes) -> Any:
+        # The journal writer uses stdlib json.dumps, which emits bare
+        # NaN/Infinity tokens for non-finite readings; orjson rejects those,
+        # so fall back to the stdlib parser for such lines.
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
 
 def read_events(
     directory: str | Path,
@@ -15,12 +34,10 @@ def read_events(
     events: list[dict[str, Any]] = []
 
     for file_path in _list_segment_files(directory):
-        with file_path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                line_text = line.strip()
-                if not line_text:
-                    continue
-                events.append(json.loads(line_text))
+        # Read the whole segment and split on raw bytes: one syscall per file
+        # and no per-line text decode before the JSON parser sees the data.
+        data = file_path.read_bytes()
+        events.extend(_json_loads(line) for line in data.split(b"\n") if line.strip())
 
     if limit is None:
         return events
@@ -44,8 +61,18 @@ def follow_events(
         for file_path in _list_segment_files(directory):
             offsets[file_path] = file_path.stat().st_size
 
+    # Segment files are only ever created (never renamed away mid-run), so the
+    # directory mtime is a cheap change signal: re-glob only when it moves.
+    root = Path(directory)
+    cached_files: list[Path] = []
+    cached_dir_mtime_ns = -1
+
     while True:
-        for file_path in _list_segment_files(directory):
+        dir_mtime_ns = root.stat().st_mtime_ns if root.exists() else -1
+        if dir_mtime_ns != cached_dir_mtime_ns:
+            cached_files = _list_segment_files(directory)
+            cached_dir_mtime_ns = dir_mtime_ns
+        for file_path in cached_files:
             start_offset = offsets.get(file_path, 0)
             with file_path.open("r", encoding="utf-8") as handle:
                 handle.seek(start_offset)
@@ -53,13 +80,22 @@ def follow_events(
                     line_text = line.strip()
                     if not line_text:
                         continue
-                    yield json.loads(line_text)
+                    yield _json_loads(line_text)
                 offsets[file_path] = handle.tell()
         time.sleep(poll_interval_s)
 
 
 def _list_segment_files(directory: str | Path) -> list[Path]:
-    root = Path(directory)
-    if not root.exists():
+    # scandir avoids glob's per-name regex match and reuses the dirent type
+    # information instead of an extra stat per file.
+    try:
+        with os.scandir(Path(directory)) as entries:
+            return sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith("trajectory-")
+                and entry.name.endswith(".jsonl")
+                and entry.is_file()
+            )
+    except FileNotFoundError:
         return []
-    return sorted(path for path in root.glob("trajectory-*.jsonl") if path.is_file())
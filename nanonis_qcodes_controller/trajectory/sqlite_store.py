@@ -2,17 +2,68 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import struct
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - numpy arrives via the qcodes extra
+    pass
+else:
+    # Instrument reads surface numpy scalars; adapt them up front so binding
+    # them as parameters stays on sqlite3's native numeric fast path instead
+    # of the per-value adapter-protocol fallback.
+    sqlite3.register_adapter(numpy.float32, float)
+    sqlite3.register_adapter(numpy.float64, float)
+    sqlite3.register_adapter(numpy.int32, int)
+    sqlite3.register_adapter(numpy.int64, int)
+
+# Hot-path SQL lives in module constants so repeated executes hit the
+# connection's prepared-statement cache on string identity.
+_SQL_INSERT_SIGNAL_SAMPLE = """
+    INSERT INTO signal_samples (run_id, signal_id, dt_s, values_json)
+    VALUES (?, ?, ?, ?)
+    """
+
+_SQL_INSERT_SPEC_SAMPLE = """
+    INSERT INTO spec_samples (run_id, spec_id, dt_s, vals_json)
+    VALUES (?, ?, ?, ?)
+    """
+
 
 class TrajectorySQLiteStore:
     def __init__(self, db_path: Path | str) -> None:
         self._db_path = Path(db_path)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._connection = sqlite3.connect(self._db_path)
+        self._connection = sqlite3.connect(self._db_path, cached_statements=256)
         self._connection.row_factory = sqlite3.Row
         self._connection.execute("PRAGMA foreign_keys = ON")
+        # WAL turns each commit into a log append with a single fsync, and
+        # synchronous=NORMAL skips the second fsync the rollback journal pays.
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.execute("PRAGMA cache_size = -65536")
+        self._connection.execute("PRAGMA temp_store = MEMORY")
+        # Dashboard readers share the file with the monitor writer; waiting
+        # out a lock beats surfacing SQLITE_BUSY mid-run.
+        self._connection.execute("PRAGMA busy_timeout = 5000")
+        # Map up to 256 MiB of the file so windowed reads hit b-tree pages
+        # through the OS page cache instead of the pager's malloc+memcpy.
+        self._connection.execute("PRAGMA mmap_size = 268435456")
+        # Run ids are immutable once created, so lookups can be served from
+        # memory after the first hit; create_run keeps both caches current.
+        self._run_id_by_name_cache: dict[str, int] = {}
+        self._latest_run_id: int | None = None
+        # Catalog labels are immutable per (run_id, signal_id); caching them
+        # lets window queries scan signal_samples alone instead of joining.
+        self._signal_label_cache: dict[tuple[int, int], str] = {}
 
     def initialize_schema(self) -> None:
         with self._connection:
@@ -52,10 +103,17 @@ class TrajectorySQLiteStore:
                     signal_id INTEGER NOT NULL,
                     dt_s REAL NOT NULL,
                     values_json TEXT NOT NULL,
+                    values_blob BLOB,
                     FOREIGN KEY(run_id) REFERENCES runs(id),
                     FOREIGN KEY(signal_id, run_id) REFERENCES signal_catalog(id, run_id)
                 )
                 """)
+            signal_sample_columns = {
+                str(row["name"])
+                for row in self._connection.execute("PRAGMA table_info(signal_samples)").fetchall()
+            }
+            if "values_blob" not in signal_sample_columns:
+                self._connection.execute("ALTER TABLE signal_samples ADD COLUMN values_blob BLOB")
             self._connection.execute("""
                 CREATE TABLE IF NOT EXISTS spec_samples (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -89,6 +147,22 @@ class TrajectorySQLiteStore:
             }
             if "delta_value" not in action_columns:
                 self._connection.execute("ALTER TABLE action_events ADD COLUMN delta_value REAL")
+            self._connection.execute("""
+                CREATE INDEX IF NOT EXISTS idx_signal_samples_run_signal_dt
+                ON signal_samples(run_id, signal_id, dt_s)
+                """)
+            self._connection.execute("""
+                CREATE INDEX IF NOT EXISTS idx_signal_samples_run_dt
+                ON signal_samples(run_id, dt_s)
+                """)
+            self._connection.execute("""
+                CREATE INDEX IF NOT EXISTS idx_spec_samples_run_spec_dt
+                ON spec_samples(run_id, spec_id, dt_s)
+                """)
+            self._connection.execute("""
+                CREATE INDEX IF NOT EXISTS idx_action_events_run_dt
+                ON action_events(run_id, dt_s, id)
+                """)
             self._connection.execute("""
                 CREATE TABLE IF NOT EXISTS monitor_errors (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -113,13 +187,9 @@ class TrajectorySQLiteStore:
         self._connection.close()
 
     def create_run(self, *, run_name: str, started_at_utc: str) -> int:
-        existing = self._connection.execute(
-            "SELECT id FROM runs WHERE run_name = ? LIMIT 1",
-            (run_name,),
-        ).fetchone()
-        if existing is not None:
-            raise ValueError(f"run_name '{run_name}' already exists; run_name must be unique.")
-
+        # No existence pre-check: the UNIQUE constraint on run_name makes the
+        # insert itself the atomic check, avoiding a second round-trip and the
+        # race between SELECT and INSERT.
         with self._connection:
             try:
                 cursor = self._connection.execute(
@@ -130,7 +200,10 @@ class TrajectorySQLiteStore:
                 raise ValueError(
                     f"run_name '{run_name}' already exists; run_name must be unique."
                 ) from exc
-        return _require_row_id(cursor.lastrowid)
+        run_id = _require_row_id(cursor.lastrowid)
+        self._run_id_by_name_cache[run_name] = run_id
+        self._latest_run_id = run_id
+        return run_id
 
     def insert_signal_catalog(
         self,
@@ -176,13 +249,31 @@ class TrajectorySQLiteStore:
         dt_s: float,
         values_json: Any,
     ) -> int:
+        with self._connection:
+            cursor = self._connection.execute(
+                _SQL_INSERT_SIGNAL_SAMPLE,
+                (run_id, signal_id, dt_s, _to_json_text(values_json)),
+            )
+        return _require_row_id(cursor.lastrowid)
+
+    def insert_signal_sample_packed(
+        self,
+        *,
+        run_id: int,
+        signal_id: int,
+        dt_s: float,
+        values: Sequence[float],
+    ) -> int:
+        # Numeric arrays go into values_blob as raw little-endian float64,
+        # roughly a third of the JSON text size with no encode/decode cost;
+        # values_json carries JSON null so the column contract stays intact.
         with self._connection:
             cursor = self._connection.execute(
                 """
-                INSERT INTO signal_samples (run_id, signal_id, dt_s, values_json)
-                VALUES (?, ?, ?, ?)
+                INSERT INTO signal_samples (run_id, signal_id, dt_s, values_json, values_blob)
+                VALUES (?, ?, ?, 'null', ?)
                 """,
-                (run_id, signal_id, dt_s, _to_json_text(values_json)),
+                (run_id, signal_id, dt_s, pack_signal_values(values)),
             )
         return _require_row_id(cursor.lastrowid)
 
@@ -196,10 +287,7 @@ class TrajectorySQLiteStore:
     ) -> int:
         with self._connection:
             cursor = self._connection.execute(
-                """
-                INSERT INTO spec_samples (run_id, spec_id, dt_s, vals_json)
-                VALUES (?, ?, ?, ?)
-                """,
+                _SQL_INSERT_SPEC_SAMPLE,
                 (run_id, spec_id, dt_s, _to_json_text(vals_json)),
             )
         return _require_row_id(cursor.lastrowid)
@@ -216,21 +304,52 @@ class TrajectorySQLiteStore:
     ) -> tuple[int, int]:
         with self._connection:
             signal_cursor = self._connection.execute(
-                """
-                INSERT INTO signal_samples (run_id, signal_id, dt_s, values_json)
-                VALUES (?, ?, ?, ?)
-                """,
+                _SQL_INSERT_SIGNAL_SAMPLE,
                 (run_id, signal_id, dt_s, _to_json_text(signal_values_json)),
             )
             spec_cursor = self._connection.execute(
-                """
-                INSERT INTO spec_samples (run_id, spec_id, dt_s, vals_json)
-                VALUES (?, ?, ?, ?)
-                """,
+                _SQL_INSERT_SPEC_SAMPLE,
                 (run_id, spec_id, dt_s, _to_json_text(spec_vals_json)),
             )
         return _require_row_id(signal_cursor.lastrowid), _require_row_id(spec_cursor.lastrowid)
 
+    def insert_sample_pairs_bulk(
+        self,
+        rows: Sequence[tuple[int, int, int, float, Any, Any]],
+    ) -> None:
+        # Each row is (run_id, signal_id, spec_id, dt_s, signal_values_json, spec_vals_json).
+        if not rows:
+            return
+        # JSON is serialized up front, in one pass, so the transaction below
+        # holds only executemany dispatch and no Python-level encoding. In
+        # steady state consecutive ticks carry equal payloads, so reuse the
+        # previous row's text when the payload has not changed: an equality
+        # check is cheaper than re-encoding.
+        signal_rows = []
+        spec_rows = []
+        last_signal_payload: Any = _UNSET
+        last_signal_text = ""
+        last_spec_payload: Any = _UNSET
+        last_spec_text = ""
+        for run_id, signal_id, spec_id, dt_s, signal_values_json, spec_vals_json in rows:
+            if signal_values_json != last_signal_payload:
+                last_signal_payload = signal_values_json
+                last_signal_text = _to_json_text(signal_values_json)
+            if spec_vals_json != last_spec_payload:
+                last_spec_payload = spec_vals_json
+                last_spec_text = _to_json_text(spec_vals_json)
+            signal_rows.append((run_id, signal_id, dt_s, last_signal_text))
+            spec_rows.append((run_id, spec_id, dt_s, last_spec_text))
+        with self._connection:
+            self._connection.executemany(
+                _SQL_INSERT_SIGNAL_SAMPLE,
+                signal_rows,
+            )
+            self._connection.executemany(
+                _SQL_INSERT_SPEC_SAMPLE,
+                spec_rows,
+            )
+
     def insert_action_event(
         self,
         *,
@@ -277,7 +396,7 @@ class TrajectorySQLiteStore:
             )
         return _require_row_id(cursor.lastrowid)
 
-    def list_action_events(self, *, run_id: int | None = None) -> list[dict[str, Any]]:
+    def iter_action_events(self, *, run_id: int | None = None) -> Iterator[dict[str, Any]]:
         if run_id is None:
             cursor = self._connection.execute("""
                 SELECT *
@@ -294,7 +413,11 @@ class TrajectorySQLiteStore:
                 """,
                 (run_id,),
             )
-        return [dict(row) for row in cursor.fetchall()]
+        for row in cursor:
+            yield dict(row)
+
+    def list_action_events(self, *, run_id: int | None = None) -> list[dict[str, Any]]:
+        return list(self.iter_action_events(run_id=run_id))
 
     def get_action_event(self, action_event_id: int) -> dict[str, Any] | None:
         cursor = self._connection.execute(
@@ -306,14 +429,16 @@ class TrajectorySQLiteStore:
             return None
         return dict(row)
 
-    def get_signal_window(
+    def iter_signal_window(
         self,
         *,
         run_id: int,
         signal_id: int,
         dt_min_s: float,
         dt_max_s: float,
-    ) -> list[dict[str, Any]]:
+    ) -> Iterator[dict[str, Any]]:
+        # Streams straight off the cursor so wide windows cost O(batch)
+        # memory instead of materializing every row up front.
         cursor = self._connection.execute(
             """
             SELECT *
@@ -323,16 +448,40 @@ class TrajectorySQLiteStore:
             """,
             (run_id, signal_id, dt_min_s, dt_max_s),
         )
-        return [dict(row) for row in cursor.fetchall()]
+        for row in cursor:
+            yield dict(row)
+
+    def get_signal_window(
+        self,
+        *,
+        run_id: int,
+        signal_id: int,
+        dt_min_s: float,
+        dt_max_s: float,
+    ) -> list[dict[str, Any]]:
+        return list(
+            self.iter_signal_window(
+                run_id=run_id,
+                signal_id=signal_id,
+                dt_min_s=dt_min_s,
+                dt_max_s=dt_max_s,
+            )
+        )
 
     def get_latest_run_id(self) -> int | None:
+        if self._latest_run_id is not None:
+            return self._latest_run_id
         cursor = self._connection.execute("SELECT id FROM runs ORDER BY id DESC LIMIT 1")
         row = cursor.fetchone()
         if row is None:
             return None
-        return int(row["id"])
+        self._latest_run_id = int(row["id"])
+        return self._latest_run_id
 
     def get_run_id_by_name(self, run_name: str) -> int | None:
+        cached = self._run_id_by_name_cache.get(run_name)
+        if cached is not None:
+            return cached
         cursor = self._connection.execute(
             "SELECT id FROM runs WHERE run_name = ? ORDER BY id DESC LIMIT 2",
             (run_name,),
@@ -344,7 +493,9 @@ class TrajectorySQLiteStore:
             raise ValueError(
                 f"Multiple runs found for run_name '{run_name}'; run_name must be unique."
             )
-        return int(rows[0]["id"])
+        run_id = int(rows[0]["id"])
+        self._run_id_by_name_cache[run_name] = run_id
+        return run_id
 
     def get_action_event_by_idx(self, *, run_id: int, action_idx: int) -> dict[str, Any] | None:
         cursor = self._connection.execute(
@@ -362,35 +513,95 @@ class TrajectorySQLiteStore:
             return None
         return dict(row)
 
-    def list_signal_samples_in_window(
+    def iter_signal_samples_in_window(
         self,
         *,
         run_id: int,
         dt_min_s: float,
         dt_max_s: float,
-    ) -> list[dict[str, Any]]:
+    ) -> Iterator[dict[str, Any]]:
         cursor = self._connection.execute(
             """
-            SELECT
-                signal_samples.id,
-                signal_samples.run_id,
-                signal_samples.signal_id,
-                signal_catalog.signal_label,
-                signal_samples.dt_s,
-                signal_samples.values_json
+            SELECT id, run_id, signal_id, dt_s, values_json
             FROM signal_samples
-            INNER JOIN signal_catalog
-                ON signal_samples.signal_id = signal_catalog.id
-                AND signal_samples.run_id = signal_catalog.run_id
-            WHERE signal_samples.run_id = ? AND signal_samples.dt_s >= ? AND signal_samples.dt_s <= ?
-            ORDER BY signal_samples.dt_s ASC, signal_samples.id ASC
+            WHERE run_id = ? AND dt_s >= ? AND dt_s <= ?
+            ORDER BY dt_s ASC, id ASC
             """,
             (run_id, dt_min_s, dt_max_s),
         )
-        return [dict(row) for row in cursor.fetchall()]
+        label_cache = self._signal_label_cache
+        for row in cursor:
+            signal_id = int(row["signal_id"])
+            label = label_cache.get((run_id, signal_id))
+            if label is None:
+                self._refresh_signal_label_cache(run_id)
+                label = label_cache[(run_id, signal_id)]
+            yield {
+                "id": row["id"],
+                "run_id": row["run_id"],
+                "signal_id": signal_id,
+                "signal_label": label,
+                "dt_s": row["dt_s"],
+                "values_json": row["values_json"],
+            }
+
+    def _refresh_signal_label_cache(self, run_id: int) -> None:
+        rows = self._connection.execute(
+            "SELECT id, signal_label FROM signal_catalog WHERE run_id = ?",
+            (run_id,),
+        ).fetchall()
+        for row in rows:
+            self._signal_label_cache[(run_id, int(row["id"]))] = str(row["signal_label"])
+
+    def list_signal_samples_in_window(
+        self,
+        *,
+        run_id: int,
+        dt_min_s: float,
+        dt_max_s: float,
+    ) -> list[dict[str, Any]]:
+        return list(
+            self.iter_signal_samples_in_window(run_id=run_id, dt_min_s=dt_min_s, dt_max_s=dt_max_s)
+        )
+
+
+# Sample widths repeat run-long, so the compiled packers are cached per count
+# instead of re-parsing the format string on every row.
+_U32_HEADER = struct.Struct("<I")
+_PACKER_CACHE: dict[int, struct.Struct] = {}
+_UNPACKER_CACHE: dict[int, struct.Struct] = {}
+
+
+def pack_signal_values(values: Sequence[float]) -> bytes:
+    count = len(values)
+    packer = _PACKER_CACHE.get(count)
+    if packer is None:
+        packer = _PACKER_CACHE[count] = struct.Struct(f"<I{count}d")
+    return packer.pack(count, *values)
+
+
+def unpack_signal_values(blob: bytes) -> tuple[float, ...]:
+    (count,) = _U32_HEADER.unpack_from(blob)
+    unpacker = _UNPACKER_CACHE.get(count)
+    if unpacker is None:
+        unpacker = _UNPACKER_CACHE[count] = struct.Struct(f"<{count}d")
+    return unpacker.unpack_from(blob, 4)
+
+
+# Sentinel for "no previous payload yet"; None is a legal payload value.
+_UNSET = object()
 
 
 def _to_json_text(value: Any) -> str:
+    if orjson is not None:
+        # orjson emits UTF-8 rather than ASCII escapes; both are valid JSON
+        # text. OPT_SERIALIZE_NUMPY keeps numpy scalars from instrument reads
+        # encodable, and anything orjson still refuses (stdlib handles numeric
+        # subclasses natively) falls through to json.dumps.
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+        except TypeError:
+            pass
     return json.dumps(value, ensure_ascii=True)
 
 
@@ -5,8 +5,6 @@ import sys
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
@@ -45,9 +43,20 @@ def parse_args() -> argparse.Namespace:
 
 
 def main() -> int:
+    # Deferred like the manifest_generator import below: yaml is only needed
+    # once arguments parse cleanly, so --help and usage errors skip it.
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as _YamlDumper
+    except ImportError:  # pragma: no cover - PyYAML built without libyaml
+        from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+
     from nanonis_qcodes_controller.qcodes_driver.manifest_generator import (
         build_unified_manifest,
         discover_nanonis_commands,
+        load_cached_manifest,
+        write_manifest_cache,
     )
 
     args = parse_args()
@@ -57,21 +66,37 @@ def main() -> int:
         explicit_curated=args.curated_files,
     )
 
-    curated_defaults, curated_parameters, curated_actions = _load_curated_inputs(curated_paths)
-    commands = list(discover_nanonis_commands(match_pattern=str(args.match)))
-    if args.limit > 0:
-        commands = commands[: args.limit]
-
-    manifest = build_unified_manifest(
-        curated_defaults=curated_defaults,
-        curated_parameters=curated_parameters,
-        curated_actions=curated_actions,
-        commands=tuple(commands),
-    )
+    # The sidecar JSON lets unfiltered re-runs skip discovery and the full
+    # manifest synthesis when no curated input has changed since the last
+    # build; --match/--limit runs bypass it since they alter the output.
+    cache_path = output_path.with_suffix(".manifest.json")
+    manifest = None
+    if not args.match and args.limit <= 0:
+        newest_input_ns = max(
+            (path.stat().st_mtime_ns for path in curated_paths if path.is_file()),
+            default=0,
+        )
+        manifest = load_cached_manifest(cache_path, newer_than_ns=newest_input_ns)
+
+    if manifest is None:
+        curated_defaults, curated_parameters, curated_actions = _load_curated_inputs(curated_paths)
+        commands = discover_nanonis_commands(
+            match_pattern=str(args.match),
+            limit=max(0, args.limit),
+        )
+
+        manifest = build_unified_manifest(
+            curated_defaults=curated_defaults,
+            curated_parameters=curated_parameters,
+            curated_actions=curated_actions,
+            commands=commands,
+        )
+        if not args.match and args.limit <= 0:
+            write_manifest_cache(cache_path, manifest)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with output_path.open("w", encoding="utf-8") as handle:
-        yaml.safe_dump(manifest, handle, sort_keys=False)
+        yaml.dump(manifest, handle, Dumper=_YamlDumper, sort_keys=False)
 
     meta = manifest.get("meta", {})
     print(f"Wrote unified parameters manifest: {output_path}")
@@ -110,6 +135,8 @@ def _resolve_curated_paths(
 def _load_curated_inputs(
     paths: list[Path],
 ) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+    import yaml
+
     defaults: dict[str, Any] = {}
     parameters: dict[str, Any] = {}
     actions: dict[str, Any] = {}
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
 import argparse
+import io
 import json
 import math
+import sys
 import time
+from collections import deque
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
 from nanonis_qcodes_controller.qcodes_driver import QcodesNanonisSTM
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
 
 @dataclass
 class SoakSummary:
@@ -79,9 +87,18 @@ def main() -> int:
 
     instrument = QcodesNanonisSTM("nanonis_soak", config_file=args.config_file, auto_connect=True)
 
-    loop_latencies_ms: list[float] = []
+    # In-loop diagnostics go through an explicitly buffered writer so stdout
+    # flushes happen on the progress timer, not inside timed loop iterations.
+    progress_out = io.TextIOWrapper(sys.stdout.buffer, line_buffering=False, write_through=False)
+
+    p50_estimator = _P2Quantile(0.50)
+    p95_estimator = _P2Quantile(0.95)
+    max_latency_ms: float | None = None
     endpoint_history: list[str] = []
-    reconnect_times: list[float] = []
+    # Four most recent reconnect timestamps are enough to spot a storm (four
+    # endpoint changes inside 60s) online, in O(1) per event.
+    recent_reconnects: deque[float] = deque(maxlen=4)
+    reconnect_storm_detected = False
 
     read_operations = 0
     read_errors = 0
@@ -97,6 +114,7 @@ def main() -> int:
     print(f"Start endpoint: {endpoint}")
 
     loop_index = 0
+    next_deadline = start + args.interval_s
 
     try:
         while True:
@@ -105,26 +123,21 @@ def main() -> int:
             if elapsed >= args.duration_s:
                 break
 
-            loop_start = time.perf_counter()
+            # Reuse the loop-top timestamp; a second perf_counter call here
+            # only measures the comparison above.
+            loop_start = now
             loop_index += 1
 
             try:
-                _assert_finite_float(instrument.bias_v())
-                _assert_finite_float(instrument.current_a())
-                _assert_finite_float(instrument.zctrl_z_m())
-                _assert_finite_float(instrument.zctrl_setpoint_a())
-                bool(instrument.zctrl_on())
-                int(instrument.scan_status_code())
-                _assert_finite_float(instrument.scan_frame_center_x_m())
-                _assert_finite_float(instrument.scan_frame_center_y_m())
-                _assert_finite_float(instrument.scan_frame_width_m())
-                _assert_finite_float(instrument.scan_frame_height_m())
-                _assert_finite_float(instrument.scan_frame_angle_deg())
-                int(instrument.signals_count())
-                read_operations += 12
+                values = instrument.read_batch(_SOAK_READ_NAMES)
+                for name, check in _SOAK_READS:
+                    check(values[name])
+                read_operations += len(_SOAK_READS)
             except Exception as exc:
                 read_errors += 1
-                print(f"Read error at loop {loop_index}: {type(exc).__name__}: {exc}")
+                progress_out.write(
+                    f"Read error at loop {loop_index}: {type(exc).__name__}: {exc}\n"
+                )
 
             if loop_index % 20 == 0:
                 try:
@@ -134,14 +147,18 @@ def main() -> int:
                     read_operations += 1
                 except Exception as exc:
                     read_errors += 1
-                    print(f"Signals error at loop {loop_index}: {type(exc).__name__}: {exc}")
+                    progress_out.write(
+                        f"Signals error at loop {loop_index}: {type(exc).__name__}: {exc}\n"
+                    )
 
             if now >= next_snapshot_time:
                 try:
                     _ = instrument.snapshot(update=True)
                 except Exception as exc:
                     snapshot_errors += 1
-                    print(f"Snapshot error at loop {loop_index}: {type(exc).__name__}: {exc}")
+                    progress_out.write(
+                        f"Snapshot error at loop {loop_index}: {type(exc).__name__}: {exc}\n"
+                    )
                 finally:
                     next_snapshot_time = now + args.snapshot_every_s
 
@@ -149,28 +166,50 @@ def main() -> int:
             current_endpoint = health.endpoint or "none"
             if current_endpoint != endpoint_history[-1]:
                 endpoint_history.append(current_endpoint)
-                reconnect_times.append(now)
-
-            loop_elapsed_ms = (time.perf_counter() - loop_start) * 1000.0
-            loop_latencies_ms.append(loop_elapsed_ms)
+                recent_reconnects.append(now)
+                if (
+                    len(recent_reconnects) == 4
+                    and recent_reconnects[-1] - recent_reconnects[0] <= 60.0
+                ):
+                    reconnect_storm_detected = True
+                    progress_out.write(
+                        f"Reconnect storm detected at loop {loop_index}; stopping soak.\n"
+                    )
+                    break
+
+            loop_end = time.perf_counter()
+            loop_elapsed_ms = (loop_end - loop_start) * 1000.0
+            p50_estimator.add(loop_elapsed_ms)
+            p95_estimator.add(loop_elapsed_ms)
+            if max_latency_ms is None or loop_elapsed_ms > max_latency_ms:
+                max_latency_ms = loop_elapsed_ms
 
             if now >= next_print_time:
-                print(
+                progress_out.write(
                     "progress "
                     f"elapsed={elapsed:.1f}s loops={loop_index} "
                     f"read_errors={read_errors} snapshot_errors={snapshot_errors} "
-                    f"endpoints={len(endpoint_history)}"
+                    f"endpoints={len(endpoint_history)}\n"
                 )
+                progress_out.flush()
                 next_print_time = now + args.print_every_s
 
-            sleep_s = args.interval_s - (time.perf_counter() - loop_start)
+            # Sleep toward a fixed deadline grid so wake-up lateness does not
+            # accumulate into loop-period drift over long soaks.
+            sleep_s = next_deadline - loop_end
             if sleep_s > 0:
                 time.sleep(sleep_s)
+                next_deadline += args.interval_s
+            else:
+                # Overran the deadline: skip whole intervals instead of
+                # firing back-to-back loops to catch up.
+                missed = math.floor(-sleep_s / args.interval_s) + 1
+                next_deadline += missed * args.interval_s
     finally:
+        progress_out.flush()
         instrument.close()
 
     duration_actual_s = time.perf_counter() - start
-    reconnect_storm_detected = _reconnect_storm_detected(reconnect_times)
 
     summary = SoakSummary(
         duration_target_s=args.duration_s,
@@ -183,50 +222,140 @@ def main() -> int:
         reconnect_events=max(0, len(endpoint_history) - 1),
         reconnect_storm_detected=reconnect_storm_detected,
         endpoint_history=endpoint_history,
-        loop_latency_ms_p50=_percentile(loop_latencies_ms, 50.0),
-        loop_latency_ms_p95=_percentile(loop_latencies_ms, 95.0),
-        loop_latency_ms_max=max(loop_latencies_ms) if loop_latencies_ms else None,
+        loop_latency_ms_p50=p50_estimator.value(),
+        loop_latency_ms_p95=p95_estimator.value(),
+        loop_latency_ms_max=max_latency_ms,
         pass_strict=(read_errors == 0 and snapshot_errors == 0 and not reconnect_storm_detected),
     )
 
+    summary_text = _dumps_indented(asdict(summary))
     if args.json_output is not None:
         args.json_output.parent.mkdir(parents=True, exist_ok=True)
-        args.json_output.write_text(json.dumps(asdict(summary), indent=2), encoding="utf-8")
+        args.json_output.write_text(summary_text, encoding="utf-8")
 
     print("-")
-    print(json.dumps(asdict(summary), indent=2))
+    print(summary_text)
     return 0 if summary.pass_strict else 1
 
 
+def _dumps_indented(payload: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(payload, indent=2)
+
+
 def _assert_finite_float(value: Any) -> None:
     numeric = float(value)
     if not math.isfinite(numeric):
         raise ValueError(f"Non-finite numeric value: {value}")
 
 
-def _percentile(values: list[float], percentile: float) -> float | None:
-    if not values:
-        return None
-    if len(values) == 1:
-        return values[0]
-
-    ordered = sorted(values)
-    idx = (len(ordered) - 1) * (percentile / 100.0)
-    lo = int(idx)
-    hi = min(lo + 1, len(ordered) - 1)
-    weight = idx - lo
-    return ordered[lo] * (1.0 - weight) + ordered[hi] * weight
-
-
-def _reconnect_storm_detected(event_times: list[float]) -> bool:
-    if len(event_times) < 4:
-        return False
-
-    for end in range(3, len(event_times)):
-        window_s = event_times[end] - event_times[end - 3]
-        if window_s <= 60.0:
-            return True
-    return False
+# The per-iteration polling sweep: one read_batch call returns every value
+# keyed by parameter name, and each name carries its own validity check.
+_SOAK_READS: tuple[tuple[str, Any], ...] = (
+    ("bias_v", _assert_finite_float),
+    ("current_a", _assert_finite_float),
+    ("zctrl_z_m", _assert_finite_float),
+    ("zctrl_setpoint_a", _assert_finite_float),
+    ("zctrl_on", bool),
+    ("scan_status_code", int),
+    ("scan_frame_center_x_m", _assert_finite_float),
+    ("scan_frame_center_y_m", _assert_finite_float),
+    ("scan_frame_width_m", _assert_finite_float),
+    ("scan_frame_height_m", _assert_finite_float),
+    ("scan_frame_angle_deg", _assert_finite_float),
+    ("signals_count", int),
+)
+_SOAK_READ_NAMES: tuple[str, ...] = tuple(name for name, _check in _SOAK_READS)
+
+
+class _P2Quantile:
+    # Jain & Chlamtac's P-squared streaming estimator: five markers track one
+    # quantile in O(1) memory, so multi-hour soaks no longer accumulate (and
+    # finally sort) one latency float per loop.
+    def __init__(self, quantile: float) -> None:
+        if not 0.0 < quantile < 1.0:
+            raise ValueError("quantile must be strictly between 0 and 1.")
+        self._quantile = quantile
+        self._initial: list[float] = []
+        self._heights: list[float] = []
+        self._positions: list[float] = []
+        self._desired: list[float] = []
+        self._increments: list[float] = []
+
+    def add(self, sample: float) -> None:
+        if len(self._initial) < 5:
+            self._initial.append(sample)
+            if len(self._initial) == 5:
+                self._initial.sort()
+                q = self._quantile
+                self._heights = list(self._initial)
+                self._positions = [1.0, 2.0, 3.0, 4.0, 5.0]
+                self._desired = [1.0, 1.0 + 2.0 * q, 1.0 + 4.0 * q, 3.0 + 2.0 * q, 5.0]
+                self._increments = [0.0, q / 2.0, q, (1.0 + q) / 2.0, 1.0]
+            return
+
+        heights = self._heights
+        positions = self._positions
+        if sample < heights[0]:
+            heights[0] = sample
+            cell = 0
+        elif sample >= heights[4]:
+            heights[4] = sample
+            cell = 3
+        else:
+            cell = 0
+            while sample >= heights[cell + 1]:
+                cell += 1
+
+        for index in range(cell + 1, 5):
+            positions[index] += 1.0
+        for index in range(5):
+            self._desired[index] += self._increments[index]
+
+        for index in range(1, 4):
+            delta = self._desired[index] - positions[index]
+            if (delta >= 1.0 and positions[index + 1] - positions[index] > 1.0) or (
+                delta <= -1.0 and positions[index - 1] - positions[index] < -1.0
+            ):
+                step = 1.0 if delta >= 1.0 else -1.0
+                candidate = self._parabolic(index, step)
+                if heights[index - 1] < candidate < heights[index + 1]:
+                    heights[index] = candidate
+                else:
+                    heights[index] = self._linear(index, step)
+                positions[index] += step
+
+    def value(self) -> float | None:
+        if self._heights:
+            return self._heights[2]
+        if not self._initial:
+            return None
+        # Fewer than five samples: fall back to exact linear interpolation.
+        ordered = sorted(self._initial)
+        idx = (len(ordered) - 1) * self._quantile
+        lo = int(idx)
+        hi = min(lo + 1, len(ordered) - 1)
+        weight = idx - lo
+        return ordered[lo] * (1.0 - weight) + ordered[hi] * weight
+
+    def _parabolic(self, index: int, step: float) -> float:
+        heights = self._heights
+        positions = self._positions
+        return heights[index] + step / (positions[index + 1] - positions[index - 1]) * (
+            (positions[index] - positions[index - 1] + step)
+            * (heights[index + 1] - heights[index])
+            / (positions[index + 1] - positions[index])
+            + (positions[index + 1] - positions[index] - step)
+            * (heights[index] - heights[index - 1])
+            / (positions[index] - positions[index - 1])
+        )
+
+    def _linear(self, index: int, step: float) -> float:
+        offset = int(step)
+        return self._heights[index] + step * (
+            self._heights[index + offset] - self._heights[index]
+        ) / (self._positions[index + offset] - self._positions[index])
 
 
 if __name__ == "__main__":
@@ -2,10 +2,16 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from pathlib import Path
 
 from nanonis_qcodes_controller.trajectory import follow_events, read_events
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Read or follow trajectory journal events.")
@@ -37,20 +43,36 @@ def main() -> int:
     if args.follow:
         print(f"Following trajectory events from: {args.directory}")
         try:
-            for event in follow_events(
+            events_iter = follow_events(
                 args.directory,
                 poll_interval_s=args.interval_s,
                 start_at_end=False,
-            ):
-                print(json.dumps(event, ensure_ascii=True))
+            )
+            if orjson is not None:
+                # orjson emits bytes, so writing to the raw buffer skips a
+                # UTF-8 encode per event on this long-running hot path.
+                out = sys.stdout.buffer
+                for event in events_iter:
+                    out.write(orjson.dumps(event))
+                    out.write(b"\n")
+                    out.flush()
+            else:
+                for event in events_iter:
+                    print(json.dumps(event, ensure_ascii=True))
         except KeyboardInterrupt:
             return 0
 
         return 0
 
     events = read_events(args.directory, limit=args.limit)
-    for event in events:
-        print(json.dumps(event, ensure_ascii=True))
+    if events:
+        # One write for the whole tail instead of a print (and potential
+        # flush) per event.
+        if orjson is not None:
+            sys.stdout.buffer.write(b"\n".join(orjson.dumps(event) for event in events) + b"\n")
+        else:
+            sys.stdout.write("\n".join(json.dumps(event, ensure_ascii=True) for event in events))
+            sys.stdout.write("\n")
     return 0
 
 
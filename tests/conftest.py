@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import yaml
+
+# CBaseLoader keeps BaseLoader's all-strings scalars (the workflow's "on" key
+# must not resolve to a boolean) while parsing with libyaml's C scanner.
+try:
+    from yaml import CBaseLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import BaseLoader as _YamlLoader  # type: ignore[assignment]
+
+from nanonis_qcodes_controller import cli
+from nanonis_qcodes_controller.qcodes_driver.extensions import (
+    ActionCommandSpec,
+    ActionSpec,
+    ArgFieldSpec,
+    ParameterSpec,
+    ReadCommandSpec,
+    ResponseFieldSpec,
+    SafetySpec,
+    WriteCommandSpec,
+)
+
+
+# Read once per session for the docs tests that assert on README content.
+@pytest.fixture(scope="session")
+def readme_text() -> str:
+    return Path("README.md").read_text(encoding="utf-8")
+
+
+# Parsed once per session: the workflow-contract tests only read the tree.
+@pytest.fixture(scope="session")
+def publish_private_workflow() -> dict[str, object]:
+    workflow_path = Path(".github/workflows/publish-private.yml")
+    assert workflow_path.exists(), "publish-private workflow is required"
+
+    workflow = yaml.load(workflow_path.read_text(encoding="utf-8"), Loader=_YamlLoader)
+    assert isinstance(workflow, dict)
+    return workflow
+
+
+# Building the argparse tree is the dominant cost of the parser tests; the
+# parser is stateless across parse_args calls, so one instance serves the
+# whole session.
+@pytest.fixture(scope="session")
+def parser() -> argparse.ArgumentParser:
+    return cli._build_parser()
+
+
+# Patches cli._print_payload and hands the test the list the payloads land in.
+@pytest.fixture
+def captured_payloads(monkeypatch) -> list[dict[str, object]]:
+    payloads: list[dict[str, object]] = []
+
+    def fake_print_payload(payload, *, as_json: bool) -> None:
+        del as_json
+        # The _cmd_* handlers never touch the payload after printing it, so
+        # keep the reference instead of shallow-copying a nested structure.
+        payloads.append(payload)
+
+    monkeypatch.setattr(cli, "_print_payload", fake_print_payload)
+    return payloads
+
+
+# Plain __enter__/__exit__ pair: no generator frame per _instrument_context
+# call, just the prebuilt (instrument, client) tuple handed back on enter.
+class _InstrumentContext:
+    def __init__(self, pair) -> None:
+        self._pair = pair
+
+    def __enter__(self):
+        return self._pair
+
+    def __exit__(self, *_exc_info) -> bool:
+        return False
+
+
+# Patches cli._instrument_context to yield the given fake instrument.
+@pytest.fixture
+def install_instrument(monkeypatch):
+    def _install(instrument) -> None:
+        context = _InstrumentContext((instrument, None))
+        monkeypatch.setattr(cli, "_instrument_context", lambda *_args, **_kwargs: context)
+
+    return _install
+
+
+# Read-only safety settings stub shared by the capability/showall tests.
+# Immutable by convention, so one module-level instance serves every call.
+_STUB_SETTINGS = SimpleNamespace(
+    safety=SimpleNamespace(
+        allow_writes=False,
+        dry_run=True,
+        default_ramp_interval_s=0.05,
+    )
+)
+
+
+@pytest.fixture
+def stub_load_settings(monkeypatch) -> None:
+    monkeypatch.setattr(cli, "load_settings", lambda config_file=None: _STUB_SETTINGS)
+
+
+# The command tests always apply the same three patches together; bundling
+# them keeps each test to a single fixture argument and one monkeypatch pass.
+@pytest.fixture
+def patched_cli(captured_payloads, install_instrument, stub_load_settings):
+    del stub_load_settings
+    return SimpleNamespace(install=install_instrument, payloads=captured_payloads)
+
+
+# The spec dataclasses are frozen, so one session-scoped instance is safe to
+# share across every test that feeds it to a fake instrument.
+@pytest.fixture(scope="session")
+def bias_parameter_spec() -> ParameterSpec:
+    return ParameterSpec(
+        name="bias_v",
+        label="Bias",
+        get_cmd=ReadCommandSpec(
+            command="Bias.Get",
+            payload_index=0,
+            description="Read configured bias voltage.",
+            arg_fields=(
+                ArgFieldSpec(
+                    name="channel",
+                    type="int",
+                    unit="",
+                    wire_type="i",
+                    required=False,
+                    description="Channel index (int)",
+                    default=1,
+                ),
+            ),
+            response_fields=(
+                ResponseFieldSpec(
+                    index=0,
+                    name="Bias value",
+                    type="float",
+                    unit="V",
+                    wire_type="f",
+                    description="Bias value (V) (float32)",
+                ),
+            ),
+        ),
+        set_cmd=WriteCommandSpec(
+            command="Bias.Set",
+            value_arg="bias",
+            description="Write configured bias voltage.",
+            arg_fields=(
+                ArgFieldSpec(
+                    name="channel",
+                    type="int",
+                    unit="",
+                    wire_type="i",
+                    required=False,
+                    description="Channel index (int)",
+                    default=1,
+                ),
+                ArgFieldSpec(
+                    name="bias",
+                    type="float",
+                    unit="V",
+                    wire_type="f",
+                    required=True,
+                    description="Bias value (V) (float32)",
+                    default=None,
+                ),
+            ),
+        ),
+        safety=SafetySpec(min_value=-10.0, max_value=10.0, max_step=1.0, ramp_enabled=True),
+        description="Tip-sample bias voltage.",
+    )
+
+
+@pytest.fixture(scope="session")
+def scan_action_spec() -> ActionSpec:
+    return ActionSpec(
+        name="Scan_Action",
+        action_cmd=ActionCommandSpec(
+            command="Scan_Action",
+            description="Start or stop scanner movement.",
+            arg_fields=(
+                ArgFieldSpec(
+                    name="Scan_action",
+                    type="int",
+                    unit="",
+                    wire_type="i",
+                    required=False,
+                    description="Scan action (int)",
+                    default=0,
+                ),
+            ),
+        ),
+        safety_mode="guarded",
+    )
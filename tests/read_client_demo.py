@@ -62,7 +62,9 @@ def main() -> int:
             print(f"Iteration {iteration}/{args.iterations}")
             for command in commands:
                 response = client.call(command)
-                value = response.get("value", response.get("payload"))
+                # Single lookup on the common path; the dict.get default form
+                # would evaluate the payload fallback on every call.
+                value = response["value"] if "value" in response else response.get("payload")
                 print(f"  {command:<16} -> {value}")
             if iteration < args.iterations and args.interval_s > 0:
                 time.sleep(args.interval_s)
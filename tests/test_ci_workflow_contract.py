@@ -4,6 +4,13 @@ from pathlib import Path
 
 import yaml
 
+# CBaseLoader keeps BaseLoader's all-strings scalars (the workflow's "on" key
+# must not resolve to a boolean) while parsing with libyaml's C scanner.
+try:
+    from yaml import CBaseLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import BaseLoader as _YamlLoader  # type: ignore[assignment]
+
 
 def _collect_steps(workflow: dict[str, object]) -> list[dict[str, object]]:
     jobs = workflow.get("jobs")
@@ -29,7 +36,7 @@ def test_ci_workflow_exists_and_includes_required_steps() -> None:
 
     assert workflow_path.exists()
 
-    workflow = yaml.load(workflow_path.read_text(encoding="utf-8"), Loader=yaml.BaseLoader)
+    workflow = yaml.load(workflow_path.read_text(encoding="utf-8"), Loader=_YamlLoader)
     assert isinstance(workflow, dict)
 
     trigger_config = workflow.get("on")
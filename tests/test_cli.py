@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import argparse
-from contextlib import contextmanager
 from datetime import datetime
 from types import SimpleNamespace
 
@@ -10,30 +9,31 @@ import pytest
 from nanonis_qcodes_controller import cli
 from nanonis_qcodes_controller.qcodes_driver.extensions import (
     DEFAULT_PARAMETERS_FILE,
-    ActionCommandSpec,
     ActionSpec,
     ArgFieldSpec,
     ParameterSpec,
     ReadCommandSpec,
-    ResponseFieldSpec,
     SafetySpec,
     WriteCommandSpec,
 )
 
 
-def test_build_ramp_targets_increasing() -> None:
-    targets = cli._build_ramp_targets(start=0.1, end=0.16, step=0.02)
-    assert targets == pytest.approx((0.1, 0.12, 0.14, 0.16))
-
-
-def test_build_ramp_targets_decreasing() -> None:
-    targets = cli._build_ramp_targets(start=0.2, end=0.05, step=0.05)
-    assert targets == pytest.approx((0.2, 0.15, 0.1, 0.05))
+@pytest.mark.parametrize(
+    ("start", "end", "step", "expected"),
+    (
+        (0.1, 0.16, 0.02, (0.1, 0.12, 0.14, 0.16)),
+        (0.2, 0.05, 0.05, (0.2, 0.15, 0.1, 0.05)),
+    ),
+)
+def test_build_ramp_targets(start: float, end: float, step: float, expected: tuple) -> None:
+    targets = cli._build_ramp_targets(start=start, end=end, step=step)
+    assert targets == pytest.approx(expected)
 
 
-def test_build_ramp_targets_rejects_non_positive_step() -> None:
+@pytest.mark.parametrize("step", (0.0, -0.02))
+def test_build_ramp_targets_rejects_non_positive_step(step: float) -> None:
     with pytest.raises(ValueError, match="positive"):
-        _ = cli._build_ramp_targets(start=0.0, end=1.0, step=0.0)
+        _ = cli._build_ramp_targets(start=0.0, end=1.0, step=step)
 
 
 def test_normalize_help_args_supports_prefix_topic_style() -> None:
@@ -41,26 +41,22 @@ def test_normalize_help_args_supports_prefix_topic_style() -> None:
     assert cli._normalize_help_args(["-h"]) == ["--help"]
 
 
-def test_json_output_is_default() -> None:
-    parser = cli._build_parser()
+def test_json_output_is_default(parser) -> None:
     args = parser.parse_args(["actions", "list"])
     assert args.json is True
 
 
-def test_text_output_opt_in_flag() -> None:
-    parser = cli._build_parser()
+def test_text_output_opt_in_flag(parser) -> None:
     args = parser.parse_args(["actions", "list", "--text"])
     assert args.json is False
 
 
-def test_showall_parser_available() -> None:
-    parser = cli._build_parser()
+def test_showall_parser_available(parser) -> None:
     args = parser.parse_args(["showall"])
     assert args.command == "showall"
 
 
-def test_policy_set_parser_accepts_boolean_overrides() -> None:
-    parser = cli._build_parser()
+def test_policy_set_parser_accepts_boolean_overrides(parser) -> None:
     args = parser.parse_args(["policy", "set", "--allow-writes", "true", "--dry-run", "false"])
     assert args.command == "policy"
     assert args.policy_command == "set"
@@ -68,14 +64,12 @@ def test_policy_set_parser_accepts_boolean_overrides() -> None:
     assert args.dry_run is False
 
 
-def test_policy_set_parser_rejects_invalid_boolean_token() -> None:
-    parser = cli._build_parser()
+def test_policy_set_parser_rejects_invalid_boolean_token(parser) -> None:
     with pytest.raises(SystemExit):
         _ = parser.parse_args(["policy", "set", "--allow-writes", "maybe"])
 
 
-def test_act_parser_supports_repeatable_arg_flags() -> None:
-    parser = cli._build_parser()
+def test_act_parser_supports_repeatable_arg_flags(parser) -> None:
     args = parser.parse_args(
         [
             "act",
@@ -92,16 +86,14 @@ def test_act_parser_supports_repeatable_arg_flags() -> None:
     assert args.plan_only is True
 
 
-def test_set_parser_accepts_negative_scientific_positional_value() -> None:
-    parser = cli._build_parser()
+def test_set_parser_accepts_negative_scientific_positional_value(parser) -> None:
     args = parser.parse_args(["set", "zctrl_setpoint_a", "-1e-11"])
     assert args.command == "set"
     assert args.parameter == "zctrl_setpoint_a"
     assert args.value == "-1e-11"
 
 
-def test_ramp_parser_accepts_negative_scientific_tokens() -> None:
-    parser = cli._build_parser()
+def test_ramp_parser_accepts_negative_scientific_tokens(parser) -> None:
     args = parser.parse_args(
         [
             "ramp",
@@ -119,7 +111,7 @@ def test_ramp_parser_accepts_negative_scientific_tokens() -> None:
     assert args.step == "-1e-11"
 
 
-def test_cmd_act_invokes_instrument_execute_action(monkeypatch) -> None:
+def test_cmd_act_invokes_instrument_execute_action(captured_payloads, install_instrument) -> None:
     class FakeInstrument:
         def execute_action(
             self,
@@ -141,18 +133,7 @@ def test_cmd_act_invokes_instrument_execute_action(monkeypatch) -> None:
                 "response": {"payload": []},
             }
 
-    @contextmanager
-    def fake_instrument_context(*_args, **_kwargs):
-        yield FakeInstrument(), None
-
-    monkeypatch.setattr(cli, "_instrument_context", fake_instrument_context)
-    captured_payloads: list[dict[str, object]] = []
-
-    def fake_print_payload(payload, *, as_json: bool) -> None:
-        del as_json
-        captured_payloads.append(dict(payload))
-
-    monkeypatch.setattr(cli, "_print_payload", fake_print_payload)
+    install_instrument(FakeInstrument())
 
     args = argparse.Namespace(
         action_name="Scan_Action",
@@ -171,7 +152,7 @@ def test_cmd_act_invokes_instrument_execute_action(monkeypatch) -> None:
     assert result["applied"] is True
 
 
-def test_cmd_ramp_normalizes_negative_step_magnitude(monkeypatch) -> None:
+def test_cmd_ramp_normalizes_negative_step_magnitude(monkeypatch, install_instrument) -> None:
     captured_step_values: list[float] = []
 
     class FakeInstrument:
@@ -203,11 +184,7 @@ def test_cmd_ramp_normalizes_negative_step_magnitude(monkeypatch) -> None:
             captured_step_values.append(step_value)
             return SimpleNamespace(dry_run=False)
 
-    @contextmanager
-    def fake_instrument_context(*_args, **_kwargs):
-        yield FakeInstrument(), None
-
-    monkeypatch.setattr(cli, "_instrument_context", fake_instrument_context)
+    install_instrument(FakeInstrument())
     monkeypatch.setattr(cli, "_print_payload", lambda payload, *, as_json: None)
 
     args = argparse.Namespace(
@@ -225,15 +202,9 @@ def test_cmd_ramp_normalizes_negative_step_magnitude(monkeypatch) -> None:
     assert captured_step_values == pytest.approx([1e-11, 1e-11])
 
 
-def test_cmd_policy_set_updates_config_and_emits_effective_policy(monkeypatch, tmp_path) -> None:
-    captured_payloads: list[dict[str, object]] = []
-
-    def fake_print_payload(payload, *, as_json: bool) -> None:
-        del as_json
-        captured_payloads.append(dict(payload))
-
-    monkeypatch.setattr(cli, "_print_payload", fake_print_payload)
-
+def test_cmd_policy_set_updates_config_and_emits_effective_policy(
+    captured_payloads, tmp_path
+) -> None:
     config_file = tmp_path / "runtime.yaml"
     config_file.write_text(
         "\n".join(
@@ -286,163 +257,143 @@ def test_now_utc_iso_is_valid_iso8601_utc() -> None:
     assert parsed.tzinfo is not None
 
 
-def test_capabilities_includes_parameter_specs_for_agents(monkeypatch) -> None:
-    spec = ParameterSpec(
-        name="bias_v",
-        label="Bias",
-        get_cmd=ReadCommandSpec(
-            command="Bias.Get",
-            payload_index=0,
-            description="Read configured bias voltage.",
-            arg_fields=(
-                ArgFieldSpec(
-                    name="channel",
-                    type="int",
-                    unit="",
-                    wire_type="i",
-                    required=False,
-                    description="Channel index (int)",
-                    default=1,
-                ),
-            ),
-            response_fields=(
-                ResponseFieldSpec(
-                    index=0,
-                    name="Bias value",
-                    type="float",
-                    unit="V",
-                    wire_type="f",
-                    description="Bias value (V) (float32)",
-                ),
-            ),
-        ),
-        set_cmd=WriteCommandSpec(
-            command="Bias.Set",
-            value_arg="bias",
-            description="Write configured bias voltage.",
-            arg_fields=(
-                ArgFieldSpec(
-                    name="channel",
-                    type="int",
-                    unit="",
-                    wire_type="i",
-                    required=False,
-                    description="Channel index (int)",
-                    default=1,
-                ),
-                ArgFieldSpec(
-                    name="bias",
-                    type="float",
-                    unit="V",
-                    wire_type="f",
-                    required=True,
-                    description="Bias value (V) (float32)",
-                    default=None,
-                ),
-            ),
-        ),
-        safety=SafetySpec(min_value=-10.0, max_value=10.0, max_step=1.0, ramp_enabled=True),
-        description="Tip-sample bias voltage.",
-    )
-    action_spec = ActionSpec(
-        name="Scan_Action",
-        action_cmd=ActionCommandSpec(
-            command="Scan_Action",
-            description="Start or stop scanner movement.",
-            arg_fields=(
-                ArgFieldSpec(
-                    name="Scan_action",
-                    type="int",
-                    unit="",
-                    wire_type="i",
-                    required=False,
-                    description="Scan action (int)",
-                    default=0,
-                ),
-            ),
-        ),
-        safety_mode="guarded",
-    )
+# _cmd_capabilities and _cmd_showall only read attributes off the namespace,
+# so one shared instance is safe across tests.
+_CAPABILITIES_ARGS = argparse.Namespace(
+    config_file=None,
+    parameters_file=str(DEFAULT_PARAMETERS_FILE),
+    include_backend_commands=False,
+    backend_match=None,
+    json=True,
+)
+
 
+def _run_capabilities(install_instrument, *, parameter_specs, action_specs):
+    # Shared body of the capabilities tests: install a fake instrument over
+    # the given specs, invoke the command, and hand back the emitted payload.
     class FakeInstrument:
         def parameter_specs(self) -> tuple[ParameterSpec, ...]:
-            return (spec,)
+            return parameter_specs
 
         def action_specs(self) -> tuple[ActionSpec, ...]:
-            return (action_spec,)
-
-    @contextmanager
-    def fake_instrument_context(*_args, **_kwargs):
-        yield FakeInstrument(), None
-
-    monkeypatch.setattr(
-        cli,
-        "load_settings",
-        lambda config_file=None: SimpleNamespace(
-            safety=SimpleNamespace(
-                allow_writes=False,
-                dry_run=True,
-                default_ramp_interval_s=0.05,
-            )
-        ),
-    )
-    monkeypatch.setattr(cli, "_instrument_context", fake_instrument_context)
+            return action_specs
 
-    captured_payloads: list[dict[str, object]] = []
+    install_instrument(FakeInstrument())
 
-    def fake_print_payload(payload, *, as_json: bool) -> None:
-        del as_json
-        captured_payloads.append(dict(payload))
+    exit_code = cli._cmd_capabilities(_CAPABILITIES_ARGS)
+    assert exit_code == cli.EXIT_OK
+    return exit_code
 
-    monkeypatch.setattr(cli, "_print_payload", fake_print_payload)
 
-    args = argparse.Namespace(
-        config_file=None,
-        parameters_file=str(DEFAULT_PARAMETERS_FILE),
-        include_backend_commands=False,
-        backend_match=None,
-        json=True,
+def test_capabilities_includes_parameter_specs_for_agents(
+    patched_cli, bias_parameter_spec, scan_action_spec
+) -> None:
+    _run_capabilities(
+        patched_cli.install,
+        parameter_specs=(bias_parameter_spec,),
+        action_specs=(scan_action_spec,),
     )
-    exit_code = cli._cmd_capabilities(args)
 
-    assert exit_code == cli.EXIT_OK
-    assert captured_payloads
-    payload = captured_payloads[-1]
-    assert set(payload.keys()) == {"parameters", "action_commands"}
-    assert "parameters" in payload
-    parameters_payload = payload["parameters"]
-    assert isinstance(parameters_payload, dict)
-    assert parameters_payload["count"] == 1
-    items = parameters_payload["items"]
-    assert isinstance(items, list)
-    parameter = items[0]
-    assert parameter["name"] == "bias_v"
-    assert "description" not in parameter
-    assert parameter["get_cmd"]["command"] == "Bias.Get"
-    assert parameter["get_cmd"]["description"] == "Read configured bias voltage."
-    assert parameter["get_cmd"]["arg_fields"][0]["name"] == "channel"
-    assert parameter["get_cmd"]["response_fields"][0]["name"] == "Bias value"
-    assert parameter["set_cmd"]["command"] == "Bias.Set"
-    assert "value_arg" not in parameter["set_cmd"]
-    assert parameter["set_cmd"]["description"] == "Write configured bias voltage."
-    assert parameter["set_cmd"]["arg_fields"][0]["name"] == "channel"
-    assert "vals" not in parameter
-    assert "unit" not in parameter
-    assert "value_type" not in parameter
-    assert "snapshot_value" not in parameter
-    actions_payload = payload["action_commands"]
-    assert isinstance(actions_payload, dict)
-    assert actions_payload["count"] == 1
-    action = actions_payload["items"][0]
-    assert action["name"] == "Scan_Action"
-    assert list(action.keys())[0] == "name"
-    assert list(action.keys())[1] == "action_cmd"
-    assert action["safety_mode"] == "guarded"
-    assert action["action_cmd"]["command"] == "Scan_Action"
-    assert action["action_cmd"]["arg_fields"][0]["name"] == "Scan_action"
-
-
-def test_capabilities_drops_top_level_description_and_empty_nested_fields(monkeypatch) -> None:
+    assert patched_cli.payloads
+    # One deep comparison against the full expected shape: it covers every
+    # field as well as the absence of dropped keys (description, value_arg,
+    # vals, unit, value_type, snapshot_value) in a single assert.
+    channel_field = {
+        "name": "channel",
+        "type": "int",
+        "unit": "",
+        "wire_type": "i",
+        "required": False,
+        "description": "Channel index (int)",
+        "default": 1,
+    }
+    expected_payload = {
+        "parameters": {
+            "count": 1,
+            "items": [
+                {
+                    "label": "Bias",
+                    "name": "bias_v",
+                    "readable": True,
+                    "writable": True,
+                    "has_ramp": True,
+                    "get_cmd": {
+                        "command": "Bias.Get",
+                        "payload_index": 0,
+                        "arg_fields": [channel_field],
+                        "response_fields": [
+                            {
+                                "index": 0,
+                                "name": "Bias value",
+                                "type": "float",
+                                "unit": "V",
+                                "wire_type": "f",
+                                "description": "Bias value (V) (float32)",
+                            }
+                        ],
+                        "description": "Read configured bias voltage.",
+                    },
+                    "set_cmd": {
+                        "command": "Bias.Set",
+                        "arg_fields": [
+                            channel_field,
+                            {
+                                "name": "bias",
+                                "type": "float",
+                                "unit": "V",
+                                "wire_type": "f",
+                                "required": True,
+                                "description": "Bias value (V) (float32)",
+                                "default": None,
+                            },
+                        ],
+                        "description": "Write configured bias voltage.",
+                    },
+                    "safety": {
+                        "min_value": -10.0,
+                        "max_value": 10.0,
+                        "max_step": 1.0,
+                        "max_slew_per_s": None,
+                        "cooldown_s": None,
+                        "ramp_enabled": True,
+                        "ramp_interval_s": None,
+                    },
+                }
+            ],
+        },
+        "action_commands": {
+            "count": 1,
+            "items": [
+                {
+                    "name": "Scan_Action",
+                    "action_cmd": {
+                        "command": "Scan_Action",
+                        "arg_fields": [
+                            {
+                                "name": "Scan_action",
+                                "type": "int",
+                                "unit": "",
+                                "wire_type": "i",
+                                "required": False,
+                                "description": "Scan action (int)",
+                                "default": 0,
+                            }
+                        ],
+                        "description": "Start or stop scanner movement.",
+                    },
+                    "safety_mode": "guarded",
+                }
+            ],
+        },
+    }
+    payload = patched_cli.payloads[-1]
+    assert payload == expected_payload
+    # Dict equality ignores ordering, but agents read "name" first.
+    action = payload["action_commands"]["items"][0]
+    assert list(action)[:2] == ["name", "action_cmd"]
+
+
+def test_capabilities_drops_top_level_description_and_empty_nested_fields(patched_cli) -> None:
     spec = ParameterSpec(
         name="zspectr_retractsecond",
         label="Zspectr Retractsecond",
@@ -474,50 +425,10 @@ def test_capabilities_drops_top_level_description_and_empty_nested_fields(monkey
         description="",
     )
 
-    class FakeInstrument:
-        def parameter_specs(self) -> tuple[ParameterSpec, ...]:
-            return (spec,)
-
-        def action_specs(self) -> tuple[ActionSpec, ...]:
-            return ()
+    _run_capabilities(patched_cli.install, parameter_specs=(spec,), action_specs=())
 
-    @contextmanager
-    def fake_instrument_context(*_args, **_kwargs):
-        yield FakeInstrument(), None
-
-    monkeypatch.setattr(
-        cli,
-        "load_settings",
-        lambda config_file=None: SimpleNamespace(
-            safety=SimpleNamespace(
-                allow_writes=False,
-                dry_run=True,
-                default_ramp_interval_s=0.05,
-            )
-        ),
-    )
-    monkeypatch.setattr(cli, "_instrument_context", fake_instrument_context)
-
-    captured_payloads: list[dict[str, object]] = []
-
-    def fake_print_payload(payload, *, as_json: bool) -> None:
-        del as_json
-        captured_payloads.append(dict(payload))
-
-    monkeypatch.setattr(cli, "_print_payload", fake_print_payload)
-
-    args = argparse.Namespace(
-        config_file=None,
-        parameters_file=str(DEFAULT_PARAMETERS_FILE),
-        include_backend_commands=False,
-        backend_match=None,
-        json=True,
-    )
-    exit_code = cli._cmd_capabilities(args)
-
-    assert exit_code == cli.EXIT_OK
-    assert captured_payloads
-    payload = captured_payloads[-1]
+    assert patched_cli.payloads
+    payload = patched_cli.payloads[-1]
     assert set(payload.keys()) == {"parameters", "action_commands"}
     parameters_payload = payload["parameters"]
     assert isinstance(parameters_payload, dict)
@@ -532,7 +443,7 @@ def test_capabilities_drops_top_level_description_and_empty_nested_fields(monkey
     assert "description" not in parameter["set_cmd"]
 
 
-def test_showall_returns_legacy_full_payload(monkeypatch) -> None:
+def test_showall_returns_legacy_full_payload(patched_cli) -> None:
     spec = ParameterSpec(
         name="bias_v",
         label="Bias",
@@ -552,42 +463,12 @@ def test_showall_returns_legacy_full_payload(monkeypatch) -> None:
             del match
             return ("Bias_Get",)
 
-    @contextmanager
-    def fake_instrument_context(*_args, **_kwargs):
-        yield FakeInstrument(), None
-
-    monkeypatch.setattr(
-        cli,
-        "load_settings",
-        lambda config_file=None: SimpleNamespace(
-            safety=SimpleNamespace(
-                allow_writes=False,
-                dry_run=True,
-                default_ramp_interval_s=0.05,
-            )
-        ),
-    )
-    monkeypatch.setattr(cli, "_instrument_context", fake_instrument_context)
-
-    captured_payloads: list[dict[str, object]] = []
-
-    def fake_print_payload(payload, *, as_json: bool) -> None:
-        del as_json
-        captured_payloads.append(dict(payload))
+    patched_cli.install(FakeInstrument())
 
-    monkeypatch.setattr(cli, "_print_payload", fake_print_payload)
-
-    args = argparse.Namespace(
-        config_file=None,
-        parameters_file=str(DEFAULT_PARAMETERS_FILE),
-        include_backend_commands=False,
-        backend_match=None,
-        json=True,
-    )
-    exit_code = cli._cmd_showall(args)
+    exit_code = cli._cmd_showall(_CAPABILITIES_ARGS)
 
     assert exit_code == cli.EXIT_OK
-    payload = captured_payloads[-1]
+    payload = patched_cli.payloads[-1]
     assert {
         "cli",
         "observables",
@@ -6,10 +6,9 @@ from nanonis_qcodes_controller.config import default_files
 from nanonis_qcodes_controller.config import settings as settings_module
 from nanonis_qcodes_controller.config.default_files import resolve_packaged_default
 from nanonis_qcodes_controller.config.settings import load_settings
-from nanonis_qcodes_controller.qcodes_driver.extensions import (
-    DEFAULT_PARAMETERS_FILE,
-    load_parameter_specs,
-)
+from nanonis_qcodes_controller.qcodes_driver import extensions as extensions_module
+from nanonis_qcodes_controller.qcodes_driver.extensions import load_parameter_specs
+from nanonis_qcodes_controller.trajectory import monitor_config as monitor_config_module
 from nanonis_qcodes_controller.trajectory.monitor_config import load_monitor_defaults
 
 
@@ -65,7 +64,11 @@ def test_load_settings_falls_back_to_packaged_runtime_defaults(tmp_path, monkeyp
         return real_resolver(name)
 
     monkeypatch.setattr(settings_module, "resolve_packaged_default", _tracking_resolver)
-    monkeypatch.chdir(tmp_path)
+    # Point the repo-default constant at a missing file instead of chdir'ing:
+    # no process-global cwd churn, and the test stays pytest-xdist safe.
+    monkeypatch.setattr(
+        settings_module, "DEFAULT_RUNTIME_CONFIG_FILE", tmp_path / "default_runtime.yaml"
+    )
 
     settings = load_settings()
 
@@ -81,15 +84,20 @@ def test_safety_settings_defaults_are_live_write_mode() -> None:
 
 
 def test_load_parameter_specs_falls_back_when_default_path_missing(tmp_path, monkeypatch) -> None:
-    monkeypatch.chdir(tmp_path)
+    missing_default = tmp_path / "parameters.yaml"
+    monkeypatch.setattr(extensions_module, "DEFAULT_PARAMETERS_FILE", missing_default)
 
-    specs = load_parameter_specs(DEFAULT_PARAMETERS_FILE)
+    specs = load_parameter_specs(missing_default)
 
     assert len(specs) > 0
 
 
 def test_load_monitor_defaults_falls_back_when_repo_defaults_missing(tmp_path, monkeypatch) -> None:
-    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        monitor_config_module,
+        "DEFAULT_MONITOR_DEFAULTS_FILE",
+        tmp_path / "default_trajectory_monitor.yaml",
+    )
 
     defaults = load_monitor_defaults()
 
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-from pathlib import Path
 
-
-def test_readme_references_unified_parameters_manifest() -> None:
-    readme = Path("README.md").read_text(encoding="utf-8")
-    assert "config/parameters.yaml" in readme
-    assert "config/default_parameters.yaml" not in readme
-    assert "config/extra_parameters.yaml" not in readme
+def test_readme_references_unified_parameters_manifest(readme_text) -> None:
+    assert "config/parameters.yaml" in readme_text
+    assert "config/default_parameters.yaml" not in readme_text
+    assert "config/extra_parameters.yaml" not in readme_text
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import pytest
+
+from nanonis_qcodes_controller.qcodes_driver.instrument import QcodesNanonisSTM
+
+
+# read_batch only touches self.get_parameter_value, so a minimal host stands
+# in for a connected instrument.
+class _BatchReadHost:
+    def __init__(self) -> None:
+        self.read_names: list[str] = []
+
+    def get_parameter_value(self, parameter_name: str) -> float:
+        self.read_names.append(parameter_name)
+        return {"bias_v": 1.5, "current_a": 2.5e-9}[parameter_name]
+
+
+def test_read_batch_aggregates_values_by_name() -> None:
+    host = _BatchReadHost()
+
+    values = QcodesNanonisSTM.read_batch(host, ("bias_v", " current_a "))
+
+    assert values == {"bias_v": 1.5, "current_a": 2.5e-9}
+    assert host.read_names == ["bias_v", "current_a"]
+
+
+@pytest.mark.parametrize("names", [(), ("bias_v", ""), ("   ",)])
+def test_read_batch_rejects_empty_names(names: tuple[str, ...]) -> None:
+    with pytest.raises(ValueError, match="non-empty"):
+        QcodesNanonisSTM.read_batch(_BatchReadHost(), names)
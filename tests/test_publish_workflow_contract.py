@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-from pathlib import Path
 from typing import Any
 
-import yaml
-
 
 def _trigger_names(trigger_config: object) -> set[str]:
     if isinstance(trigger_config, str):
@@ -40,13 +37,8 @@ def _normalized_step_name(step: dict[str, Any]) -> str:
     return " ".join(name.lower().split())
 
 
-def test_publish_private_workflow_contract() -> None:
-    workflow_path = Path(".github/workflows/publish-private.yml")
-
-    assert workflow_path.exists(), "publish-private workflow is required"
-
-    workflow = yaml.load(workflow_path.read_text(encoding="utf-8"), Loader=yaml.BaseLoader)
-    assert isinstance(workflow, dict)
+def test_publish_private_workflow_contract(publish_private_workflow) -> None:
+    workflow = publish_private_workflow
 
     triggers = _trigger_names(workflow.get("on"))
     assert "workflow_dispatch" in triggers
@@ -67,13 +59,14 @@ def test_publish_private_workflow_contract() -> None:
         assert smoke_needs == "publish"
 
     publish_steps = _job_steps(jobs["publish"])
+    # Normalize each step name once; every check below is a membership test
+    # against these precomputed strings.
+    step_names = [_normalized_step_name(step) for step in publish_steps]
 
     provenance_step_indexes = [
         index
-        for index, step in enumerate(publish_steps)
-        if "provenance" in _normalized_step_name(step)
-        and "validate" in _normalized_step_name(step)
-        and "build run" in _normalized_step_name(step)
+        for index, name in enumerate(step_names)
+        if "provenance" in name and "validate" in name and "build run" in name
     ]
     assert provenance_step_indexes, (
         "publish job must validate source build run provenance before download"
@@ -108,9 +101,8 @@ def test_publish_private_workflow_contract() -> None:
 
     artifact_version_step_indexes = [
         index
-        for index, step in enumerate(publish_steps)
-        if "artifact version" in _normalized_step_name(step)
-        and "package_version" in str(step.get("run"))
+        for index, (name, step) in enumerate(zip(step_names, publish_steps))
+        if "artifact version" in name and "package_version" in str(step.get("run"))
     ]
     assert artifact_version_step_indexes, (
         "publish job must validate artifact version against package_version input"
@@ -1,17 +1,16 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
 
 from nanonis_qcodes_controller.trajectory.monitor import TrajectoryMonitorRunner
 from nanonis_qcodes_controller.trajectory.sqlite_store import TrajectorySQLiteStore
 
+# None of these tests reopen the database file, so an in-memory store keeps
+# the sampling assertions while skipping file creation and fsync traffic.
 
-def test_run_iterations_writes_signal_and_spec_rows_and_increments_sample_idx(
-    tmp_path: Path,
-) -> None:
-    db_path = tmp_path / "trajectory.sqlite3"
-    store = TrajectorySQLiteStore(db_path)
+
+def test_run_iterations_writes_signal_and_spec_rows_and_increments_sample_idx() -> None:
+    store = TrajectorySQLiteStore(":memory:")
     try:
         store.initialize_schema()
         run_id = store.create_run(run_name="run-001", started_at_utc="2026-02-22T00:00:00Z")
@@ -60,9 +59,8 @@ def test_run_iterations_writes_signal_and_spec_rows_and_increments_sample_idx(
         store.close()
 
 
-def test_segment_rotation_uses_rotate_entries_boundary(tmp_path: Path) -> None:
-    db_path = tmp_path / "trajectory.sqlite3"
-    store = TrajectorySQLiteStore(db_path)
+def test_segment_rotation_uses_rotate_entries_boundary() -> None:
+    store = TrajectorySQLiteStore(":memory:")
     try:
         store.initialize_schema()
         run_id = store.create_run(run_name="run-001", started_at_utc="2026-02-22T00:00:00Z")
@@ -125,9 +123,8 @@ def test_segment_rotation_uses_rotate_entries_boundary(tmp_path: Path) -> None:
         store.close()
 
 
-def test_dt_s_is_non_negative_and_monotonic_increasing(tmp_path: Path) -> None:
-    db_path = tmp_path / "trajectory.sqlite3"
-    store = TrajectorySQLiteStore(db_path)
+def test_dt_s_is_non_negative_and_monotonic_increasing() -> None:
+    store = TrajectorySQLiteStore(":memory:")
     try:
         store.initialize_schema()
         run_id = store.create_run(run_name="run-001", started_at_utc="2026-02-22T00:00:00Z")
@@ -160,9 +157,8 @@ def test_dt_s_is_non_negative_and_monotonic_increasing(tmp_path: Path) -> None:
         store.close()
 
 
-def test_run_iterations_uses_interval_s_for_drift_aware_cadence(tmp_path: Path) -> None:
-    db_path = tmp_path / "trajectory.sqlite3"
-    store = TrajectorySQLiteStore(db_path)
+def test_run_iterations_uses_interval_s_for_drift_aware_cadence() -> None:
+    store = TrajectorySQLiteStore(":memory:")
     try:
         store.initialize_schema()
         run_id = store.create_run(run_name="run-001", started_at_utc="2026-02-22T00:00:00Z")
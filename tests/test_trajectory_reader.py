@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+
+from nanonis_qcodes_controller.trajectory.reader import read_events
+
+
+def test_read_events_accepts_non_finite_floats_from_journal_writer(tmp_path: Path) -> None:
+    # The journal serializes with stdlib json.dumps, whose allow_nan default
+    # emits bare NaN/Infinity tokens; the reader must accept its own writer's
+    # output regardless of which parser backend is installed.
+    events = [
+        {"event_type": "spec_change", "payload": {"state_key": "bias_v", "value": float("nan")}},
+        {"event_type": "spec_change", "payload": {"state_key": "bias_v", "value": float("inf")}},
+        {"event_type": "spec_change", "payload": {"state_key": "bias_v", "value": 0.5}},
+    ]
+    segment_path = tmp_path / "trajectory-1-00001.jsonl"
+    segment_path.write_text(
+        "".join(json.dumps(event, ensure_ascii=True) + "\n" for event in events),
+        encoding="utf-8",
+    )
+
+    loaded = read_events(tmp_path)
+
+    assert len(loaded) == 3
+    assert math.isnan(loaded[0]["payload"]["value"])
+    assert math.isinf(loaded[1]["payload"]["value"])
+    assert loaded[2]["payload"]["value"] == 0.5
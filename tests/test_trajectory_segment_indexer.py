@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from nanonis_qcodes_controller.trajectory.indexer import SqliteSegmentIndexer
+from nanonis_qcodes_controller.trajectory.sqlite_store import TrajectorySQLiteStore
+
+
+def _write_segment(path: Path, events: list[dict[str, object]]) -> None:
+    path.write_text("".join(json.dumps(event) + "\n" for event in events), encoding="utf-8")
+
+
+def _sample_pair_event(
+    *, run_id: int, signal_id: int, spec_id: int, dt_s: float
+) -> dict[str, object]:
+    return {
+        "event_type": "sample_pair",
+        "payload": {
+            "run_id": run_id,
+            "signal_id": signal_id,
+            "spec_id": spec_id,
+            "dt_s": dt_s,
+            "signal_values": {"Z Position": 1.0},
+            "spec_values": {"Bias": 0.5},
+        },
+    }
+
+
+def test_index_new_segments_bulk_loads_sample_pairs(tmp_path: Path) -> None:
+    db_path = tmp_path / "trajectory.sqlite3"
+    journal_dir = tmp_path / "journal"
+    journal_dir.mkdir()
+    store = TrajectorySQLiteStore(db_path)
+    try:
+        store.initialize_schema()
+        run_id = store.create_run(run_name="run-001", started_at_utc="2026-02-22T00:00:00Z")
+        signal_id = store.insert_signal_catalog(run_id=run_id, signal_label="segment-0")
+        spec_id = store.insert_spec_catalog(run_id=run_id, spec_label="segment-0")
+        _write_segment(
+            journal_dir / "trajectory-1-00001.jsonl",
+            [
+                _sample_pair_event(run_id=run_id, signal_id=signal_id, spec_id=spec_id, dt_s=0.1),
+                {"event_type": "journal_started", "payload": {}},
+                _sample_pair_event(run_id=run_id, signal_id=signal_id, spec_id=spec_id, dt_s=0.2),
+            ],
+        )
+
+        indexer = SqliteSegmentIndexer(store=store, directory=journal_dir)
+        indexed_rows = indexer.index_new_segments()
+
+        signal_rows = store._connection.execute(
+            "SELECT dt_s FROM signal_samples WHERE run_id = ? ORDER BY id ASC",
+            (run_id,),
+        ).fetchall()
+
+        assert indexed_rows == 2
+        assert [row["dt_s"] for row in signal_rows] == [0.1, 0.2]
+        assert indexer.indexed_file_names() == {"trajectory-1-00001.jsonl"}
+    finally:
+        store.close()
+
+
+def test_index_new_segments_skips_indexed_and_active_files(tmp_path: Path) -> None:
+    db_path = tmp_path / "trajectory.sqlite3"
+    journal_dir = tmp_path / "journal"
+    journal_dir.mkdir()
+    store = TrajectorySQLiteStore(db_path)
+    try:
+        store.initialize_schema()
+        run_id = store.create_run(run_name="run-001", started_at_utc="2026-02-22T00:00:00Z")
+        signal_id = store.insert_signal_catalog(run_id=run_id, signal_label="segment-0")
+        spec_id = store.insert_spec_catalog(run_id=run_id, spec_label="segment-0")
+        rotated = journal_dir / "trajectory-1-00001.jsonl"
+        active = journal_dir / "trajectory-1-00002.jsonl"
+        _write_segment(
+            rotated,
+            [_sample_pair_event(run_id=run_id, signal_id=signal_id, spec_id=spec_id, dt_s=0.1)],
+        )
+        _write_segment(
+            active,
+            [_sample_pair_event(run_id=run_id, signal_id=signal_id, spec_id=spec_id, dt_s=0.2)],
+        )
+
+        indexer = SqliteSegmentIndexer(store=store, directory=journal_dir)
+
+        assert indexer.index_new_segments(skip_file=active) == 1
+        assert indexer.index_new_segments() == 1
+        assert indexer.index_new_segments() == 0
+        assert indexer.indexed_file_names() == {
+            "trajectory-1-00001.jsonl",
+            "trajectory-1-00002.jsonl",
+        }
+    finally:
+        store.close()
+
+
+def test_index_new_segments_accepts_non_finite_floats(tmp_path: Path) -> None:
+    db_path = tmp_path / "trajectory.sqlite3"
+    journal_dir = tmp_path / "journal"
+    journal_dir.mkdir()
+    store = TrajectorySQLiteStore(db_path)
+    try:
+        store.initialize_schema()
+        run_id = store.create_run(run_name="run-001", started_at_utc="2026-02-22T00:00:00Z")
+        signal_id = store.insert_signal_catalog(run_id=run_id, signal_label="segment-0")
+        spec_id = store.insert_spec_catalog(run_id=run_id, spec_label="segment-0")
+        # stdlib json.dumps emits a bare NaN token for non-finite readings;
+        # the indexer must decode its own journal's output.
+        event = _sample_pair_event(run_id=run_id, signal_id=signal_id, spec_id=spec_id, dt_s=0.1)
+        payload = event["payload"]
+        assert isinstance(payload, dict)
+        payload["signal_values"] = {"Z Position": float("nan")}
+        _write_segment(journal_dir / "trajectory-1-00001.jsonl", [event])
+
+        indexer = SqliteSegmentIndexer(store=store, directory=journal_dir)
+        indexed_rows = indexer.index_new_segments()
+
+        assert indexed_rows == 1
+        assert indexer.indexed_file_names() == {"trajectory-1-00001.jsonl"}
+    finally:
+        store.close()
@@ -6,7 +6,10 @@ from pathlib import Path
 
 import pytest
 
-from nanonis_qcodes_controller.trajectory.sqlite_store import TrajectorySQLiteStore
+from nanonis_qcodes_controller.trajectory.sqlite_store import (
+    TrajectorySQLiteStore,
+    unpack_signal_values,
+)
 
 REQUIRED_TABLES: set[str] = {
     "runs",
@@ -189,6 +192,71 @@ def test_insert_sample_pair_rolls_back_if_second_insert_fails(tmp_path: Path) ->
         store.close()
 
 
+def test_packed_signal_sample_round_trips_float_values(tmp_path: Path) -> None:
+    db_path = tmp_path / "trajectory.sqlite3"
+    store = TrajectorySQLiteStore(db_path)
+    try:
+        store.initialize_schema()
+        run_id = store.create_run(run_name="run-001", started_at_utc="2026-02-22T00:00:00Z")
+        signal_id = store.insert_signal_catalog(run_id=run_id, signal_label="Z Position", unit="m")
+        store.insert_signal_sample_packed(
+            run_id=run_id,
+            signal_id=signal_id,
+            dt_s=0.1,
+            values=[1.0, -2.5, 3.25],
+        )
+
+        rows = store.get_signal_window(
+            run_id=run_id,
+            signal_id=signal_id,
+            dt_min_s=0.0,
+            dt_max_s=1.0,
+        )
+
+        assert len(rows) == 1
+        assert json.loads(rows[0]["values_json"]) is None
+        assert unpack_signal_values(rows[0]["values_blob"]) == (1.0, -2.5, 3.25)
+    finally:
+        store.close()
+
+
+def test_insert_sample_pairs_bulk_preserves_row_order(tmp_path: Path) -> None:
+    db_path = tmp_path / "trajectory.sqlite3"
+    store = TrajectorySQLiteStore(db_path)
+    try:
+        store.initialize_schema()
+        run_id = store.create_run(run_name="run-001", started_at_utc="2026-02-22T00:00:00Z")
+        signal_id = store.insert_signal_catalog(run_id=run_id, signal_label="Z Position", unit="m")
+        spec_id = store.insert_spec_catalog(run_id=run_id, spec_label="Bias", unit="V")
+
+        store.insert_sample_pairs_bulk(
+            [
+                (run_id, signal_id, spec_id, 0.1, {"Z Position": 1.0}, {"Bias": 0.5}),
+                (run_id, signal_id, spec_id, 0.2, {"Z Position": 2.0}, {"Bias": 0.6}),
+                (run_id, signal_id, spec_id, 0.3, {"Z Position": 3.0}, {"Bias": 0.7}),
+            ]
+        )
+
+        signal_rows = store._connection.execute(
+            "SELECT dt_s, values_json FROM signal_samples WHERE run_id = ? ORDER BY id ASC",
+            (run_id,),
+        ).fetchall()
+        spec_rows = store._connection.execute(
+            "SELECT dt_s, vals_json FROM spec_samples WHERE run_id = ? ORDER BY id ASC",
+            (run_id,),
+        ).fetchall()
+
+        assert [row["dt_s"] for row in signal_rows] == [0.1, 0.2, 0.3]
+        assert [row["dt_s"] for row in spec_rows] == [0.1, 0.2, 0.3]
+        assert [json.loads(row["values_json"]) for row in signal_rows] == [
+            {"Z Position": 1.0},
+            {"Z Position": 2.0},
+            {"Z Position": 3.0},
+        ]
+    finally:
+        store.close()
+
+
 def test_create_run_rejects_duplicate_run_name(tmp_path: Path) -> None:
     db_path = tmp_path / "trajectory.sqlite3"
     store = TrajectorySQLiteStore(db_path)
@@ -200,3 +268,64 @@ def test_create_run_rejects_duplicate_run_name(tmp_path: Path) -> None:
             store.create_run(run_name="run-001", started_at_utc="2026-02-22T00:01:00Z")
     finally:
         store.close()
+
+
+def test_sample_payloads_accept_numpy_scalars(tmp_path: Path) -> None:
+    numpy = pytest.importorskip("numpy")
+    db_path = tmp_path / "trajectory.sqlite3"
+    store = TrajectorySQLiteStore(db_path)
+    try:
+        store.initialize_schema()
+        run_id = store.create_run(run_name="run-001", started_at_utc="2026-02-22T00:00:00Z")
+        signal_id = store.insert_signal_catalog(run_id=run_id, signal_label="Z Position", unit="m")
+        spec_id = store.insert_spec_catalog(run_id=run_id, spec_label="Bias", unit="V")
+
+        # Instrument reads surface numpy scalars; the JSON encoder must accept
+        # them on every insert path, not just the stdlib fallback.
+        store.insert_sample_pair(
+            run_id=run_id,
+            signal_id=signal_id,
+            spec_id=spec_id,
+            dt_s=0.1,
+            signal_values_json={"Z Position": numpy.float64(1.25)},
+            spec_vals_json={"Bias": numpy.int64(2)},
+        )
+        store.insert_sample_pairs_bulk(
+            [
+                (
+                    run_id,
+                    signal_id,
+                    spec_id,
+                    0.2,
+                    {"Z Position": numpy.float64(2.5)},
+                    {"Bias": numpy.int64(3)},
+                ),
+            ]
+        )
+        event_id = store.insert_action_event(
+            run_id=run_id,
+            dt_s=0.2,
+            action_kind="spec-change",
+            detected_at_utc="2026-02-22T00:00:01Z",
+            spec_label="Bias",
+            signal_window_start_dt_s=0.0,
+            signal_window_end_dt_s=0.4,
+            old_value_json=numpy.float64(0.5),
+            new_value_json=numpy.float64(0.75),
+        )
+
+        signal_rows = store._connection.execute(
+            "SELECT values_json FROM signal_samples WHERE run_id = ? ORDER BY id ASC",
+            (run_id,),
+        ).fetchall()
+        event = store.get_action_event(event_id)
+
+        assert [json.loads(row["values_json"]) for row in signal_rows] == [
+            {"Z Position": 1.25},
+            {"Z Position": 2.5},
+        ]
+        assert event is not None
+        assert json.loads(event["old_value_json"]) == 0.5
+        assert json.loads(event["new_value_json"]) == 0.75
+    finally:
+        store.close()